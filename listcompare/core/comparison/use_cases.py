@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
-from typing import Optional
+from typing import AbstractSet, Optional
 
 from ..products.product_diff import (
     ProductMap,
@@ -16,7 +16,7 @@ from ..products.product_schema import Product
 MismatchMap = dict[str, dict[str, list[Product]]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComparisonResults:
     """Buckets returned by the HiCore versus Magento comparison flow."""
 
@@ -26,7 +26,7 @@ class ComparisonResults:
     internal_only_candidates: Optional[ProductMap]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupplierComparisonResults:
     """Buckets returned by the supplier-versus-HiCore comparison flow."""
 
@@ -37,7 +37,7 @@ class SupplierComparisonResults:
     article_number_review_matches: tuple["SupplierArticleNumberReviewMatch", ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupplierArticleNumberReviewMatch:
     """Potential HiCore-supplier match found via article number instead of SKU."""
 
@@ -54,7 +54,11 @@ def _build_normalized_article_number_map(product_map: ProductMap) -> dict[str, l
             key = normalize_sku(str(product.article_number).strip())
             if key == "":
                 continue
-            out.setdefault(key, []).append(product)
+            existing = out.get(key)
+            if existing is None:
+                out[key] = [product]
+            else:
+                existing.append(product)
     return out
 
 
@@ -114,32 +118,48 @@ def filter_products_by_supplier_with_sku(
     """Keep HiCore rows for one supplier and drop entries without a usable SKU."""
 
     target = supplier_name.casefold()
+    # Casefold each distinct supplier name once instead of once per product row.
+    supplier_names = {p.supplier for rows in hicore_map.values() for p in rows}
+    matching_suppliers = {
+        name for name in supplier_names if (name or "").casefold() == target
+    }
     comparable: ProductMap = {}
+    if not matching_suppliers:
+        return comparable
     for sku, rows in hicore_map.items():
-        filtered_rows = [p for p in rows if (p.supplier or "").casefold() == target]
-        if not filtered_rows:
-            continue
         if sku.strip() == "":
             continue
-        comparable[sku] = filtered_rows
+        filtered_rows = [p for p in rows if p.supplier in matching_suppliers]
+        if filtered_rows:
+            comparable[sku] = filtered_rows
     return comparable
 
 
 def filter_product_map_by_excluded_normalized_skus(
     product_map: ProductMap,
-    excluded_normalized_skus: set[str],
+    excluded_normalized_skus: AbstractSet[str],
 ) -> ProductMap:
     """Drop rows whose normalized SKU belongs to the supplied exclusion set."""
 
     if not excluded_normalized_skus:
         return product_map
 
-    filtered: ProductMap = {}
-    for sku, rows in product_map.items():
-        if normalize_sku(sku) in excluded_normalized_skus:
-            continue
-        filtered[sku] = rows
-    return filtered
+    normalize = normalize_sku
+    return {
+        sku: rows
+        for sku, rows in product_map.items()
+        if normalize(sku) not in excluded_normalized_skus
+    }
+
+
+def _usable_excluded_skus(
+    excluded_normalized_skus: Optional[AbstractSet[str]],
+) -> AbstractSet[str]:
+    if not excluded_normalized_skus:
+        return frozenset()
+    if "" not in excluded_normalized_skus:
+        return excluded_normalized_skus
+    return excluded_normalized_skus - {""}
 
 
 def build_comparison_results(
@@ -148,19 +168,32 @@ def build_comparison_results(
     *,
     supplier_map: Optional[ProductMap] = None,
     supplier_internal_name: str = "EM Nordic",
-    excluded_normalized_skus: Optional[set[str]] = None,
+    excluded_normalized_skus: Optional[AbstractSet[str]] = None,
 ) -> ComparisonResults:
     """Build the compare buckets that drive the core HiCore-Magento UI."""
 
-    excluded_set = {sku for sku in (excluded_normalized_skus or set()) if sku != ""}
+    excluded_set = _usable_excluded_skus(excluded_normalized_skus)
     if excluded_set:
         hicore_map = filter_product_map_by_excluded_normalized_skus(hicore_map, excluded_set)
         magento_map = filter_product_map_by_excluded_normalized_skus(magento_map, excluded_set)
         if supplier_map is not None:
             supplier_map = filter_product_map_by_excluded_normalized_skus(supplier_map, excluded_set)
 
-    only_in_hicore, only_in_magento = find_missing_skus(hicore_map, magento_map)
-    stock_mismatches = find_field_mismatches_by_sku(hicore_map, magento_map, field="stock")
+    hicore_norm = build_normalized_map(hicore_map)
+    magento_norm = build_normalized_map(magento_map)
+    only_in_hicore, only_in_magento = find_missing_skus(
+        hicore_map,
+        magento_map,
+        hicore_norm_map=hicore_norm,
+        magento_norm_map=magento_norm,
+    )
+    stock_mismatches = find_field_mismatches_by_sku(
+        hicore_map,
+        magento_map,
+        field="stock",
+        hicore_norm_map=hicore_norm,
+        magento_norm_map=magento_norm,
+    )
 
     internal_only_candidates: Optional[ProductMap] = None
     if supplier_map is not None:
@@ -194,17 +227,24 @@ def build_supplier_comparison_results(
     supplier_map: ProductMap,
     *,
     supplier_internal_name: str,
-    excluded_normalized_skus: Optional[set[str]] = None,
+    excluded_normalized_skus: Optional[AbstractSet[str]] = None,
 ) -> SupplierComparisonResults:
     """Build supplier compare buckets, including article-number review matches."""
 
-    excluded_set = {sku for sku in (excluded_normalized_skus or set()) if sku != ""}
+    excluded_set = _usable_excluded_skus(excluded_normalized_skus)
     if excluded_set:
         hicore_map = filter_product_map_by_excluded_normalized_skus(hicore_map, excluded_set)
         supplier_map = filter_product_map_by_excluded_normalized_skus(supplier_map, excluded_set)
 
     hicore_comparable = filter_products_by_supplier_with_sku(hicore_map, supplier_internal_name)
-    outgoing, new_products = find_missing_skus(hicore_comparable, supplier_map)
+    hicore_norm = build_normalized_map(hicore_comparable)
+    supplier_norm = build_normalized_map(supplier_map)
+    outgoing, new_products = find_missing_skus(
+        hicore_comparable,
+        supplier_map,
+        hicore_norm_map=hicore_norm,
+        magento_norm_map=supplier_norm,
+    )
     article_number_review_matches, matched_outgoing_skus, matched_new_product_skus = (
         _build_article_number_review_matches(outgoing, new_products)
     )
@@ -216,8 +256,6 @@ def build_supplier_comparison_results(
             matched_new_product_skus,
         )
 
-    hicore_norm = build_normalized_map(hicore_comparable)
-    supplier_norm = build_normalized_map(supplier_map)
     shared_keys = set(hicore_norm.keys()) & set(supplier_norm.keys())
 
     price_updates_out_of_stock: MismatchMap = {}
@@ -255,10 +293,10 @@ def build_supplier_comparison_results(
 def unique_sorted_skus_from_product_map(product_map: ProductMap) -> list[str]:
     """Return distinct non-empty SKUs from a product map in stable sorted order."""
 
-    skus: list[str] = []
+    skus: set[str] = set()
     for rows in product_map.values():
-        skus.extend(p.sku for p in rows if (p.sku or "").strip() != "")
-    return sorted(set(skus))
+        skus.update(p.sku for p in rows if (p.sku or "").strip() != "")
+    return sorted(skus)
 
 
 def unique_sorted_skus_from_mismatch_side(
@@ -267,7 +305,7 @@ def unique_sorted_skus_from_mismatch_side(
 ) -> list[str]:
     """Return distinct non-empty SKUs from one side of a mismatch map."""
 
-    skus: list[str] = []
+    skus: set[str] = set()
     for sides in mismatch_map.values():
-        skus.extend(p.sku for p in sides.get(side, []) if (p.sku or "").strip() != "")
-    return sorted(set(skus))
+        skus.update(p.sku for p in sides.get(side, []) if (p.sku or "").strip() != "")
+    return sorted(skus)
@@ -1,4 +1,6 @@
 from __future__ import annotations
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple
 
 from .product_schema import Product
@@ -6,6 +8,9 @@ from .product_schema import Product
 ProductMap = Dict[str, List[Product]]
 
 
+# SKUs repeat across maps, exclusion sets and table sorting within a run. The
+# cache is bounded because the Streamlit server process is long-lived.
+@lru_cache(maxsize=1 << 17)
 def normalize_sku(sku: str) -> str:
     s = sku.strip()
     if s == "":
@@ -23,11 +28,17 @@ def normalize_comparable_sku(sku: str) -> Optional[str]:
 
 def build_normalized_map(product_map: ProductMap) -> Dict[str, List[Product]]:
     out: Dict[str, List[Product]] = {}
+    normalize = normalize_sku
     for sku, rows in product_map.items():
-        key = normalize_comparable_sku(sku)
-        if key is None:
+        key = normalize(sku)
+        if key == "":
             continue
-        out.setdefault(key, []).extend(rows)
+        existing = out.get(key)
+        if existing is None:
+            # Copy so later extends never mutate the caller's row lists.
+            out[key] = list(rows)
+        else:
+            existing.extend(rows)
     return out
 
 
@@ -51,35 +62,69 @@ def list_empty_field_rows(product_map: ProductMap, *, field: str) -> List[Produc
     return out
 
 
+def _comparable_sku_keys(product_map: ProductMap) -> Dict[str, str]:
+    normalize = normalize_sku
+    keys: Dict[str, str] = {}
+    for sku in product_map:
+        key = normalize(sku)
+        if key != "":
+            keys[sku] = key
+    return keys
+
+
 def find_missing_products_by_sku(
     left_map: ProductMap,
     right_map: ProductMap,
+    *,
+    left_norm_map: Optional[Dict[str, List[Product]]] = None,
+    right_norm_map: Optional[Dict[str, List[Product]]] = None,
 ) -> Tuple[ProductMap, ProductMap]:
-    left_norm = set(build_normalized_map(left_map).keys())
-    right_norm = set(build_normalized_map(right_map).keys())
-
-    only_in_right: ProductMap = {}
-    for right_sku, right_rows in right_map.items():
-        normalized_right_sku = normalize_comparable_sku(right_sku)
-        if normalized_right_sku is None:
-            continue
-        if normalized_right_sku not in left_norm:
-            only_in_right[right_sku] = right_rows
-
-    only_in_left: ProductMap = {}
-    for left_sku, left_rows in left_map.items():
-        normalized_left_sku = normalize_comparable_sku(left_sku)
-        if normalized_left_sku is None:
-            continue
-        if normalized_left_sku not in right_norm:
-            only_in_left[left_sku] = left_rows
+    # Callers that already built the normalized maps can pass them in so the
+    # comparable key sets are not rebuilt here.
+    left_keys = _comparable_sku_keys(left_map)
+    right_keys = _comparable_sku_keys(right_map)
+    left_norm = left_norm_map.keys() if left_norm_map is not None else set(left_keys.values())
+    right_norm = right_norm_map.keys() if right_norm_map is not None else set(right_keys.values())
+
+    only_left_norm = left_norm - right_norm
+    only_right_norm = right_norm - left_norm
+
+    only_in_right: ProductMap = (
+        {
+            right_sku: right_map[right_sku]
+            for right_sku, normalized_right_sku in right_keys.items()
+            if normalized_right_sku in only_right_norm
+        }
+        if only_right_norm
+        else {}
+    )
+    only_in_left: ProductMap = (
+        {
+            left_sku: left_map[left_sku]
+            for left_sku, normalized_left_sku in left_keys.items()
+            if normalized_left_sku in only_left_norm
+        }
+        if only_left_norm
+        else {}
+    )
 
     return only_in_left, only_in_right
 
 
-def find_missing_skus(hicore_map: ProductMap, magento_map: ProductMap) -> Tuple[ProductMap, ProductMap]:
+def find_missing_skus(
+    hicore_map: ProductMap,
+    magento_map: ProductMap,
+    *,
+    hicore_norm_map: Optional[Dict[str, List[Product]]] = None,
+    magento_norm_map: Optional[Dict[str, List[Product]]] = None,
+) -> Tuple[ProductMap, ProductMap]:
     # Backward-compatible alias for existing callers.
-    return find_missing_products_by_sku(hicore_map, magento_map)
+    return find_missing_products_by_sku(
+        hicore_map,
+        magento_map,
+        left_norm_map=hicore_norm_map,
+        right_norm_map=magento_norm_map,
+    )
 
 
 def find_field_mismatches_by_sku(
@@ -87,6 +132,8 @@ def find_field_mismatches_by_sku(
     magento_map: ProductMap,
     *,
     field: str,  # "name" | "stock"
+    hicore_norm_map: Optional[Dict[str, List[Product]]] = None,
+    magento_norm_map: Optional[Dict[str, List[Product]]] = None,
 ) -> Dict[str, Dict[str, List[Product]]]:
 
     if field not in {"name", "stock"}:
@@ -94,19 +141,19 @@ def find_field_mismatches_by_sku(
 
     out: Dict[str, Dict[str, List[Product]]] = {}
 
-    hicore_norm_map = build_normalized_map(hicore_map)
-    magento_norm_map = build_normalized_map(magento_map)
+    if hicore_norm_map is None:
+        hicore_norm_map = build_normalized_map(hicore_map)
+    if magento_norm_map is None:
+        magento_norm_map = build_normalized_map(magento_map)
 
     shared_keys = set(hicore_norm_map.keys()) & set(magento_norm_map.keys())
 
+    field_value = attrgetter(field)
     for key in shared_keys:
         h_rows = hicore_norm_map[key]
         m_rows = magento_norm_map[key]
 
-        h_values = {getattr(p, field) for p in h_rows}
-        m_values = {getattr(p, field) for p in m_rows}
-
-        if h_values != m_values:
+        if set(map(field_value, h_rows)) != set(map(field_value, m_rows)):
             out[key] = {"hicore": h_rows, "magento": m_rows}
 
     return out
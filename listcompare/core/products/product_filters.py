@@ -1,12 +1,31 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import AbstractSet, Callable, Optional
 
 import pandas as pd
 
 from .product_diff import normalize_sku
 
 
+def _stripped_text(value: object) -> str:
+    return str(value).strip()
+
+
+def raw_brands_with_folded_text_in(
+    raw_brands: pd.Series,
+    folded_brands: AbstractSet[str],
+    *,
+    brand_text: Callable[[object], str] = _stripped_text,
+) -> list[object]:
+    # Brands repeat across many rows, so fold each distinct value once; callers then
+    # match rows on the raw values with Series.isin.
+    return [
+        value
+        for value in raw_brands.dropna().unique()
+        if brand_text(value).casefold() in folded_brands
+    ]
+
+
 def normalized_skus_from_brand_filter(
     df_hicore: pd.DataFrame,
     *,
@@ -23,25 +42,16 @@ def normalized_skus_from_brand_filter(
         return set(), False
 
     selected_folded = {name.casefold() for name in selected_brands}
-    excluded_normalized_skus: set[str] = set()
-    for raw_brand, raw_sku in zip(
-        df_hicore[brand_column].tolist(),
-        df_hicore[sku_column].tolist(),
-    ):
-        if pd.isna(raw_brand):
-            continue
-
-        brand_name = str(raw_brand).strip()
-        if brand_name == "" or brand_name.casefold() == "nan":
-            continue
-        if brand_name.casefold() not in selected_folded:
-            continue
-
-        if pd.isna(raw_sku):
-            continue
-
-        normalized = normalize_sku(str(raw_sku))
-        if normalized != "":
-            excluded_normalized_skus.add(normalized)
+    selected_folded -= {"", "nan"}
+    raw_brands = df_hicore[brand_column]
+    matching_brands = raw_brands_with_folded_text_in(raw_brands, selected_folded)
+    raw_skus = df_hicore[sku_column]
+    selected_rows = raw_brands.isin(matching_brands) & raw_skus.notna()
+    if not selected_rows.any():
+        return set(), False
 
+    # Dedupe in pandas first so normalize_sku runs once per distinct raw SKU.
+    selected_skus = raw_skus[selected_rows].astype(str).unique()
+    excluded_normalized_skus = set(map(normalize_sku, selected_skus))
+    excluded_normalized_skus.discard("")
     return excluded_normalized_skus, False
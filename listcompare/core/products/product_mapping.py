@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from typing import AbstractSet, Optional
 
 import pandas as pd
 
+from .product_diff import normalize_sku
 from .product_normalization import (
-    compute_hicore_stock_with_fallback,
+    compute_hicore_stock_with_fallback_values,
     normalise_price,
-    normalise_stock,
-    to_str,
+    normalise_stock_values,
 )
 from .product_schema import HICORE_COLUMNS, MAGENTO_COLUMNS, Product
 from .repair_magento_export import repair_shifted_magento_rows
@@ -20,11 +21,25 @@ def _column_values(df: pd.DataFrame, column_name: str | None) -> list[object]:
     return df[column_name].tolist()
 
 
+def _column_series(df: pd.DataFrame, column_name: str | None) -> pd.Series:
+    if not column_name or column_name not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[column_name]
+
+
+def _column_text_values(df: pd.DataFrame, column_name: str | None) -> list[str]:
+    if not column_name or column_name not in df.columns:
+        return [""] * len(df.index)
+    values = df[column_name]
+    return values.where(values.notna(), "").astype(str).str.strip().tolist()
+
+
 def build_product_map(
     df: pd.DataFrame,
     *,
     source: str,
     columns: dict[str, str | None],
+    excluded_normalized_skus: Optional[AbstractSet[str]] = None,
 ) -> dict[str, list[Product]]:
     sku_col = columns["sku"]
     name_col = columns["name"]
@@ -35,41 +50,36 @@ def build_product_map(
     price_col = columns.get("price")
     supplier_col = columns.get("supplier")
 
-    sku_values = _column_values(df, sku_col)
-    name_values = _column_values(df, name_col)
-    stock_values = _column_values(df, stock_col)
-    article_number_values = _column_values(df, article_number_col)
-    total_values = _column_values(df, total_col)
-    reserved_values = _column_values(df, reserved_col)
+    sku_values = _column_text_values(df, sku_col)
+    name_values = _column_text_values(df, name_col)
+    article_number_values = _column_text_values(df, article_number_col)
     price_values = _column_values(df, price_col)
-    supplier_values = _column_values(df, supplier_col)
-    to_str_value = to_str
+    supplier_values = _column_text_values(df, supplier_col)
+    if source == "hicore":
+        stock_values = compute_hicore_stock_with_fallback_values(
+            _column_series(df, total_col),
+            _column_series(df, reserved_col),
+            _column_series(df, stock_col),
+        )
+    else:
+        stock_values = normalise_stock_values(_column_series(df, stock_col))
     normalize_price_value = normalise_price
-    normalize_stock_value = normalise_stock
-    compute_hicore_stock_with_fallback_value = compute_hicore_stock_with_fallback
+    normalize = normalize_sku
+    excluded = excluded_normalized_skus or None
 
     products: dict[str, list[Product]] = defaultdict(list)
-    for sku_raw, article_number_raw, name_raw, stock_raw, total_raw, reserved_raw, price_raw, supplier_raw in zip(
+    for sku, article_number, name, stock, price_raw, supplier in zip(
         sku_values,
         article_number_values,
         name_values,
         stock_values,
-        total_values,
-        reserved_values,
         price_values,
         supplier_values,
     ):
-        sku = to_str_value(sku_raw)
-        article_number = to_str_value(article_number_raw)
-        name = to_str_value(name_raw)
-        supplier = to_str_value(supplier_raw) if supplier_col else ""
+        if excluded is not None and sku and normalize(sku) in excluded:
+            continue
         price = normalize_price_value(price_raw) if price_col else ""
 
-        if source == "hicore":
-            stock = compute_hicore_stock_with_fallback_value(total_raw, reserved_raw, stock_raw)
-        else:
-            stock = normalize_stock_value(stock_raw)
-
         products[sku].append(
             Product(
                 sku=sku,
@@ -85,11 +95,17 @@ def build_product_map(
     return dict(products)
 
 
-def prepare_data(df_hicore: pd.DataFrame, df_magento: pd.DataFrame):
+def prepare_data(
+    df_hicore: pd.DataFrame,
+    df_magento: pd.DataFrame,
+    *,
+    excluded_normalized_skus: Optional[AbstractSet[str]] = None,
+):
     hicore_map = build_product_map(
         df_hicore,
         source="hicore",
         columns=HICORE_COLUMNS,
+        excluded_normalized_skus=excluded_normalized_skus,
     )
 
     df_magento_fixed, _n_fixed = repair_shifted_magento_rows(df_magento)
@@ -97,5 +113,6 @@ def prepare_data(df_hicore: pd.DataFrame, df_magento: pd.DataFrame):
         df_magento_fixed,
         source="magento",
         columns=MAGENTO_COLUMNS,
+        excluded_normalized_skus=excluded_normalized_skus,
     )
     return hicore_map, magento_map
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 import re
 
 import pandas as pd
 
+# Integer stock values are the common case and can be normalised in bulk; longer
+# values stay on the Decimal path so int64 never overflows.
+_INTEGER_STOCK_PATTERN = r"-?\d{1,15}"
+_STOCK_TEXT_TRANSLATION = str.maketrans({" ": "", "\u00a0": "", ",": "."})
+
 
 def to_str(value) -> str:
     if pd.isna(value):
@@ -20,19 +26,10 @@ def normalise_stock(value) -> str:
     if raw == "":
         return ""
 
-    normalized_raw = raw.replace(" ", "").replace("\u00a0", "").replace(",", ".")
-    try:
-        parsed = Decimal(normalized_raw)
-    except InvalidOperation:
+    parsed = _parse_stock_text(raw)
+    if parsed is None:
         return raw
-
-    if parsed == 0:
-        return "0"
-
-    out = format(parsed, "f")
-    if "." in out:
-        out = out.rstrip("0").rstrip(".")
-    return out
+    return _format_decimal(parsed)
 
 
 def normalise_price(value) -> str:
@@ -102,9 +99,15 @@ def _to_decimal(value) -> Decimal | None:
     raw = str(value).strip()
     if raw == "":
         return None
-    normalized_raw = raw.replace(" ", "").replace("\u00a0", "").replace(",", ".")
+    return _parse_stock_text(raw)
+
+
+# Stock columns repeat a small vocabulary ("0", "1", "2", ...) across rows, so
+# the Decimal parse is cached per stripped text rather than redone per cell.
+@lru_cache(maxsize=1 << 14)
+def _parse_stock_text(raw: str) -> Decimal | None:
     try:
-        return Decimal(normalized_raw)
+        return Decimal(raw.translate(_STOCK_TEXT_TRANSLATION))
     except InvalidOperation:
         return None
 
@@ -134,3 +137,66 @@ def compute_hicore_stock_with_fallback(total_raw, reserved_raw, stock_raw) -> st
     if computed_stock != "":
         return computed_stock
     return normalise_stock(stock_raw)
+
+
+def normalize_sku_values(values: pd.Series) -> pd.Series:
+    """Vectorised ``normalize_sku`` for a whole column; missing values become ``""``."""
+
+    text = values.where(values.notna(), "").astype(str).str.strip()
+    unpadded = text.str.lstrip("0")
+    return unpadded.mask(unpadded.eq("") & text.ne(""), "0")
+
+
+def _cleaned_stock_text(values: pd.Series) -> tuple[pd.Series, pd.Series]:
+    text = values.where(values.notna(), "").astype(str).str.strip()
+    cleaned = text.str.translate(_STOCK_TEXT_TRANSLATION)
+    return text, cleaned
+
+
+def normalise_stock_values(values: pd.Series) -> list[str]:
+    """Vectorised ``normalise_stock`` for a whole column."""
+
+    values = values.reset_index(drop=True)
+    text, cleaned = _cleaned_stock_text(values)
+    out = pd.Series("", index=values.index, dtype=object)
+    is_integer = cleaned.str.fullmatch(_INTEGER_STOCK_PATTERN)
+    if is_integer.any():
+        out[is_integer] = cleaned[is_integer].astype("int64").astype(str)
+    needs_decimal = ~is_integer & (text != "")
+    if needs_decimal.any():
+        out[needs_decimal] = values[needs_decimal].map(normalise_stock)
+    return out.tolist()
+
+
+def compute_hicore_stock_with_fallback_values(
+    total_values: pd.Series,
+    reserved_values: pd.Series,
+    stock_values: pd.Series,
+) -> list[str]:
+    """Vectorised ``compute_hicore_stock_with_fallback`` for aligned columns."""
+
+    total_values = total_values.reset_index(drop=True)
+    reserved_values = reserved_values.reset_index(drop=True)
+    stock_values = stock_values.reset_index(drop=True)
+    _total_text, total_cleaned = _cleaned_stock_text(total_values)
+    reserved_text, reserved_cleaned = _cleaned_stock_text(reserved_values)
+    total_is_integer = total_cleaned.str.fullmatch(_INTEGER_STOCK_PATTERN)
+    reserved_is_integer = reserved_cleaned.str.fullmatch(_INTEGER_STOCK_PATTERN)
+    fast_path = total_is_integer & (reserved_is_integer | (reserved_text == ""))
+
+    out = pd.Series("", index=total_values.index, dtype=object)
+    if fast_path.any():
+        totals = total_cleaned[fast_path].astype("int64")
+        reserved = reserved_cleaned[fast_path].where(reserved_is_integer[fast_path], "0")
+        out[fast_path] = (totals - reserved.astype("int64")).astype(str)
+    slow_path = ~fast_path
+    if slow_path.any():
+        out[slow_path] = [
+            compute_hicore_stock_with_fallback(total_raw, reserved_raw, stock_raw)
+            for total_raw, reserved_raw, stock_raw in zip(
+                total_values[slow_path].tolist(),
+                reserved_values[slow_path].tolist(),
+                stock_values[slow_path].tolist(),
+            )
+        ]
+    return out.tolist()
@@ -25,7 +25,7 @@ MAGENTO_COLUMNS = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Product:
     sku: str
     name: str
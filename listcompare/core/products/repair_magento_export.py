@@ -1,14 +1,12 @@
 import pandas as pd
 
-def _to_str(x) -> str:
-    if pd.isna(x):
-        return ""
-    return str(x).strip()
+def _to_str_series(values: pd.Series) -> pd.Series:
+    return values.where(values.notna(), "").astype(str).str.strip()
 
-def repair_shifted_magento_rows(df_magento: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+def _strip_quoted(values: pd.Series) -> pd.Series:
+    return values.str.strip().str.strip('"').str.strip()
 
-    df = df_magento.copy()
-    fixed = 0
+def repair_shifted_magento_rows(df_magento: pd.DataFrame) -> tuple[pd.DataFrame, int]:
 
     col_name = "name"
     col_sku = "sku"
@@ -17,37 +15,39 @@ def repair_shifted_magento_rows(df_magento: pd.DataFrame) -> tuple[pd.DataFrame,
     col_url = "url"
 
     for c in (col_name, col_sku, col_price, col_qty, col_url):
-        if c not in df.columns:
+        if c not in df_magento.columns:
             return df_magento, 0
 
-    for i in range(len(df)):
-        name = _to_str(df.at[i, col_name])
-        sku = _to_str(df.at[i, col_sku])
-        price = _to_str(df.at[i, col_price])
-        qty = _to_str(df.at[i, col_qty])
-        url = _to_str(df.at[i, col_url])
-
-        if url != "":
-            continue
-        if not qty.lower().startswith("http"):
-            continue
-        if ";" not in name:
-            continue
-
-        name_left, sku_right = name.split(";", 1)
-
-        sku_right = sku_right.strip().strip('"').strip()
-
-        if sku_right == "":
-            continue
-
-        df.at[i, col_url] = qty
-        df.at[i, col_qty] = price
-        df.at[i, col_price] = sku
-        df.at[i, col_sku] = sku_right
-        df.at[i, col_name] = name_left.strip().strip('"').strip()
-
-        fixed += 1
+    name = _to_str_series(df_magento[col_name])
+    sku = _to_str_series(df_magento[col_sku])
+    price = _to_str_series(df_magento[col_price])
+    qty = _to_str_series(df_magento[col_qty])
+    url = _to_str_series(df_magento[col_url])
+
+    shifted = (
+        (url == "")
+        & qty.str.lower().str.startswith("http")
+        & name.str.contains(";", regex=False)
+    )
+    if not shifted.any():
+        return df_magento, 0
+
+    name_parts = name.str.split(";", n=1)
+    name_left = _strip_quoted(name_parts.str[0].fillna(""))
+    sku_right = _strip_quoted(name_parts.str[1].fillna(""))
+    shifted &= sku_right != ""
+    fixed = int(shifted.sum())
+    if fixed == 0:
+        return df_magento, 0
+
+    # Shallow copy: every repaired column is replaced wholesale below, so the
+    # caller's frame is never mutated and untouched columns are not duplicated.
+    df = df_magento.copy(deep=False)
+    df[col_url] = df_magento[col_url].mask(shifted, qty)
+    df[col_qty] = df_magento[col_qty].mask(shifted, price)
+    df[col_price] = df_magento[col_price].mask(shifted, sku)
+    df[col_sku] = df_magento[col_sku].mask(shifted, sku_right)
+    df[col_name] = df_magento[col_name].mask(shifted, name_left)
 
     return df, fixed
 
@@ -16,12 +16,15 @@ from ..profile import (
     ordered_supplier_transform_profile_mapping,
 )
 
+_SIGNATURE_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True)
+
 
 def supplier_prepare_signature(
     *,
     supplier_name: str,
     supplier_file_name: str,
     supplier_bytes: bytes,
+    supplier_file_digest: Optional[str] = None,
     profile_mapping: Optional[dict[str, str]] = None,
     profile_composite_fields: Optional[dict[str, list[str]]] = None,
     profile_filters: Optional[dict[str, object]] = None,
@@ -43,7 +46,10 @@ def supplier_prepare_signature(
     payload = {
         "supplier_name": str(supplier_name).strip(),
         "supplier_file_name": str(supplier_file_name).strip(),
-        "supplier_file_sha1": hashlib.sha1(supplier_bytes).hexdigest(),
+        # Callers that already hold a digest of the upload pass it so the signature, rebuilt
+        # on every rerun, does not re-hash the whole file.
+        "supplier_file_digest": supplier_file_digest
+        or hashlib.sha1(bytes(supplier_bytes)).hexdigest(),
         "profile_mapping": ordered_supplier_transform_profile_mapping(
             normalized_profile_mapping
         ),
@@ -67,5 +73,5 @@ def supplier_prepare_signature(
             ),
         },
     }
-    serialized = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+    serialized = _SIGNATURE_ENCODER.encode(payload)
     return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
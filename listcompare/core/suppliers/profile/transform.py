@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+from ...products.product_filters import raw_brands_with_folded_text_in
 from .constants import (
     SUPPLIER_HICORE_ARTICLE_NUMBER_COLUMN,
     SUPPLIER_HICORE_RENAME_COLUMNS,
@@ -21,17 +24,17 @@ from .normalize import (
 )
 from .validation import _profile_required_source_columns
 
+_SUPPLIER_HICORE_RENAME_COLUMN_SET = frozenset(SUPPLIER_HICORE_RENAME_COLUMNS)
+
 
 def find_duplicate_names(values: list[str]) -> list[str]:
     """Return duplicate names once each, sorted case-insensitively."""
 
-    counts: dict[str, int] = {}
-    duplicates: list[str] = []
-    for value in values:
-        counts[value] = counts.get(value, 0) + 1
-        if counts[value] == 2:
-            duplicates.append(value)
-    return sorted(duplicates, key=lambda item: item.casefold())
+    # Column and source lists are almost always unique; a set settles that without counting.
+    if len(set(values)) == len(values):
+        return []
+    duplicates = [value for value, count in Counter(values).items() if count > 1]
+    return sorted(duplicates, key=str.casefold)
 
 
 def normalize_supplier_transform_sku_value(
@@ -59,12 +62,25 @@ def _supplier_transform_cell_text(raw_value: object) -> str:
     return _normalize_profile_text(raw_value)
 
 
-def _build_composite_supplier_value(row: pd.Series, *, source_columns: list[str]) -> str:
-    parts = [
-        _supplier_transform_cell_text(row.get(source_column, ""))
+def _build_composite_supplier_values(
+    df_supplier: pd.DataFrame,
+    *,
+    source_columns: list[str],
+) -> list[str]:
+    # Column-wise instead of iterrows(): no Series is built per row, and each column keeps
+    # its own values rather than a row-wise common dtype.
+    if not source_columns:
+        return [""] * len(df_supplier)
+    column_texts = [
+        [
+            _supplier_transform_cell_text(raw_value)
+            for raw_value in df_supplier[source_column].tolist()
+        ]
+        if source_column in df_supplier.columns
+        else [""] * len(df_supplier)
         for source_column in source_columns
     ]
-    return " ".join(part for part in parts if part != "")
+    return [" ".join(part for part in parts if part != "") for parts in zip(*column_texts)]
 
 
 def _normalized_identifier_values(
@@ -73,11 +89,23 @@ def _normalized_identifier_values(
     source_column: str,
     strip_leading_zeros_from_sku: bool,
 ) -> pd.Series:
-    return df_supplier[source_column].map(
-        lambda raw_value: normalize_supplier_transform_sku_value(
+    # Identifier columns repeat values (stock codes, article numbers), so each distinct value
+    # is normalized once and spread back by its factorize code; missing values get code -1,
+    # which picks the trailing "".
+    values = df_supplier[source_column]
+    codes, distinct_values = pd.factorize(values)
+    normalized = [
+        normalize_supplier_transform_sku_value(
             raw_value,
             strip_leading_zeros=strip_leading_zeros_from_sku,
         )
+        for raw_value in distinct_values
+    ]
+    normalized.append("")
+    return pd.Series(
+        np.array(normalized, dtype=object)[codes],
+        index=values.index,
+        name=values.name,
     )
 
 
@@ -99,9 +127,12 @@ def build_supplier_hicore_renamed_copy(
     """
 
     normalized_target_to_source = {
-        str(target).strip(): str(source).strip()
-        for target, source in target_to_source.items()
-        if str(target).strip() in SUPPLIER_HICORE_RENAME_COLUMNS and str(source).strip() != ""
+        target: source
+        for target, source in (
+            (str(raw_target).strip(), str(raw_source).strip())
+            for raw_target, raw_source in target_to_source.items()
+        )
+        if target in _SUPPLIER_HICORE_RENAME_COLUMN_SET and source != ""
     }
     normalized_composite_fields = (
         normalize_supplier_transform_profile_composite_fields(composite_fields)
@@ -126,10 +157,11 @@ def build_supplier_hicore_renamed_copy(
         }
     )
 
-    prepared_df = df_supplier.copy()
+    # Shallow copy: columns are only ever replaced wholesale below, never written
+    # in place, so the caller's frame is left untouched without duplicating data.
+    prepared_df = df_supplier.copy(deep=False)
     prepared_df.columns = [str(col).strip() for col in prepared_df.columns]
 
-    available_columns = {str(col).strip() for col in prepared_df.columns}
     required_sources = sorted(
         _profile_required_source_columns(
             normalized_target_to_source,
@@ -138,12 +170,15 @@ def build_supplier_hicore_renamed_copy(
         ),
         key=lambda item: item.casefold(),
     )
-    missing_sources = [source for source in required_sources if source not in available_columns]
+    # The column labels were stripped just above, so they can be checked as they are.
+    missing_sources = set(required_sources).difference(prepared_df.columns)
     if missing_sources:
         raise ValueError(
-            "Vald(e) kolumn(er) finns inte i leverantörsfilen: " + ", ".join(missing_sources)
+            "Vald(e) kolumn(er) finns inte i leverantörsfilen: "
+            + ", ".join(source for source in required_sources if source in missing_sources)
         )
 
+    keep_rows = pd.Series(True, index=prepared_df.index)
     configured_brand_source = str(
         normalized_filters[SUPPLIER_TRANSFORM_FILTER_BRAND_SOURCE_COLUMN]
     ).strip()
@@ -153,11 +188,13 @@ def build_supplier_hicore_renamed_copy(
         if str(value).strip() != ""
     }
     if configured_brand_source != "" and excluded_brand_values_folded:
-        brand_matches = prepared_df[configured_brand_source].map(
-            lambda raw_value: _supplier_transform_cell_text(raw_value).casefold()
-            in excluded_brand_values_folded
+        raw_brands = prepared_df[configured_brand_source]
+        excluded_raw_brands = raw_brands_with_folded_text_in(
+            raw_brands,
+            excluded_brand_values_folded,
+            brand_text=_supplier_transform_cell_text,
         )
-        prepared_df = prepared_df.loc[~brand_matches].copy()
+        keep_rows &= ~raw_brands.isin(excluded_raw_brands)
 
     sku_source_column = normalized_target_to_source.get(SUPPLIER_HICORE_SKU_COLUMN)
     if sku_source_column is not None:
@@ -179,38 +216,36 @@ def build_supplier_hicore_renamed_copy(
                 normalized_sku_values != "",
                 normalized_article_number_values,
             )
-        prepared_df.loc[:, sku_source_column] = normalized_sku_values
-        prepared_df = prepared_df.loc[normalized_sku_values != ""].copy()
+        prepared_df[sku_source_column] = normalized_sku_values
+        keep_rows &= normalized_sku_values != ""
+
+    if not keep_rows.all():
+        # Only the required source columns are read from here on, so the row filter copies
+        # just those instead of every column of a wide supplier sheet.
+        prepared_df = prepared_df.loc[keep_rows, required_sources]
 
-    renamed_df = pd.DataFrame(index=prepared_df.index)
-    ordered_targets: list[str] = []
+    # Collect the output columns in order and build the frame once on a fresh index,
+    # instead of inserting, reordering and re-indexing a frame (a copy per step).
+    output_columns: dict[str, object] = {}
     for target_column in SUPPLIER_HICORE_RENAME_COLUMNS:
         if target_column in normalized_composite_fields:
-            renamed_df[target_column] = prepared_df.apply(
-                lambda row: _build_composite_supplier_value(
-                    row,
-                    source_columns=normalized_composite_fields[target_column],
-                ),
-                axis=1,
+            output_columns[target_column] = _build_composite_supplier_values(
+                prepared_df,
+                source_columns=normalized_composite_fields[target_column],
             )
-            ordered_targets.append(target_column)
             continue
 
         source_column = normalized_target_to_source.get(target_column)
         if source_column is None:
             continue
-        renamed_df[target_column] = prepared_df[source_column]
-        ordered_targets.append(target_column)
+        output_columns[target_column] = prepared_df[source_column].to_numpy()
 
-    renamed_df[SUPPLIER_HICORE_SUPPLIER_COLUMN] = normalized_supplier_name
-    ordered_output_columns = [*ordered_targets, SUPPLIER_HICORE_SUPPLIER_COLUMN]
+    output_columns[SUPPLIER_HICORE_SUPPLIER_COLUMN] = normalized_supplier_name
 
     normalized_source_row_column = str(source_row_column).strip()
     if normalized_source_row_column != "":
-        renamed_df[normalized_source_row_column] = prepared_df.index.map(
-            lambda raw_index: int(raw_index) + 2
-        )
-        ordered_output_columns.append(normalized_source_row_column)
+        output_columns[normalized_source_row_column] = [
+            int(raw_index) + 2 for raw_index in prepared_df.index
+        ]
 
-    renamed_df = renamed_df.loc[:, ordered_output_columns]
-    return renamed_df.reset_index(drop=True)
+    return pd.DataFrame(output_columns, index=pd.RangeIndex(len(prepared_df)))
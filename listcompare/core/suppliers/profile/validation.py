@@ -24,11 +24,8 @@ def _profile_required_source_columns(
     composite_fields: Optional[dict[str, list[str]]] = None,
     filters: Optional[dict[str, object]] = None,
 ) -> set[str]:
-    required_sources = {
-        str(source).strip()
-        for source in mapping.values()
-        if str(source).strip() != ""
-    }
+    required_sources = {str(source).strip() for source in mapping.values()}
+    required_sources.discard("")
     normalized_composite_fields = composite_fields if isinstance(composite_fields, dict) else {}
     for source_columns in normalized_composite_fields.values():
         for source_column in source_columns:
@@ -58,17 +55,15 @@ def missing_profile_source_columns(
     composite_fields: Optional[dict[str, list[str]]] = None,
     filters: Optional[dict[str, object]] = None,
 ) -> list[str]:
-    available_columns = {str(column).strip() for column in source_columns}
-    missing = {
-        source
-        for source in _profile_required_source_columns(
-            mapping,
-            composite_fields=composite_fields,
-            filters=filters,
-        )
-        if source not in available_columns
-    }
-    return sorted(missing, key=lambda item: item.casefold())
+    required_sources = _profile_required_source_columns(
+        mapping,
+        composite_fields=composite_fields,
+        filters=filters,
+    )
+    if not required_sources:
+        return []
+    missing = required_sources.difference(str(column).strip() for column in source_columns)
+    return sorted(missing, key=str.casefold)
 
 
 def matches_profile_output_format(
@@ -78,19 +73,22 @@ def matches_profile_output_format(
     composite_fields: Optional[dict[str, list[str]]] = None,
 ) -> bool:
     available_columns = {str(column).strip() for column in source_columns}
-    required_targets = {
-        target for target in SUPPLIER_HICORE_RENAME_COLUMNS if str(mapping.get(target, "")).strip() != ""
-    }
-    normalized_composite_fields = composite_fields if isinstance(composite_fields, dict) else {}
-    required_targets.update(
-        {
-            target
-            for target, source_columns_for_target in normalized_composite_fields.items()
-            if target in SUPPLIER_TRANSFORM_COMPOSITE_SUPPORTED_TARGETS and source_columns_for_target
-        }
-    )
-    if not required_targets:
+    # Raw supplier exports lack the HiCore supplier column, so most files fail here at once.
+    if SUPPLIER_HICORE_SUPPLIER_COLUMN not in available_columns:
         return False
-    has_all_targets = all(target in available_columns for target in required_targets)
-    has_supplier_column = SUPPLIER_HICORE_SUPPLIER_COLUMN in available_columns
-    return has_all_targets and has_supplier_column
+
+    has_required_target = False
+    for target in SUPPLIER_HICORE_RENAME_COLUMNS:
+        if str(mapping.get(target, "")).strip() == "":
+            continue
+        if target not in available_columns:
+            return False
+        has_required_target = True
+    normalized_composite_fields = composite_fields if isinstance(composite_fields, dict) else {}
+    for target, source_columns_for_target in normalized_composite_fields.items():
+        if target not in SUPPLIER_TRANSFORM_COMPOSITE_SUPPORTED_TARGETS or not source_columns_for_target:
+            continue
+        if target not in available_columns:
+            return False
+        has_required_target = True
+    return has_required_target
@@ -23,6 +23,14 @@ def _column_values(df_supplier: pd.DataFrame, column_name: Optional[str]) -> lis
     return df_supplier[column_name].tolist()
 
 
+def _clean_text_values(df_supplier: pd.DataFrame, column_name: Optional[str]) -> list[str]:
+    if column_name is None or column_name not in df_supplier.columns:
+        return [""] * len(df_supplier.index)
+    values = df_supplier[column_name]
+    text = values.where(values.notna(), "").astype(str).str.strip()
+    return text.mask(text.str.casefold() == "nan", "").tolist()
+
+
 def find_supplier_id_column(
     df_supplier: pd.DataFrame,
     *,
@@ -94,31 +102,21 @@ def build_supplier_map(
         preferred_columns=preferred_name_columns,
     )
     article_number_col = find_supplier_article_number_column(df_supplier)
-    id_values = _column_values(df_supplier, id_col)
+    id_values = _clean_text_values(df_supplier, id_col)
     price_values = _column_values(df_supplier, price_col)
-    name_values = _column_values(df_supplier, name_col)
-    article_number_values = _column_values(df_supplier, article_number_col)
+    name_values = _clean_text_values(df_supplier, name_col)
+    article_number_values = _clean_text_values(df_supplier, article_number_col)
     products: ProductMap = defaultdict(list)
 
     normalize_price_value = normalise_price
-    for raw_sku, raw_price, raw_name, raw_article_number in zip(
+    for sku, raw_price, name, article_number in zip(
         id_values,
         price_values,
         name_values,
         article_number_values,
     ):
-        if pd.isna(raw_sku):
-            continue
-
-        sku = str(raw_sku).strip()
-        if sku == "" or sku.casefold() == "nan":
+        if sku == "":
             continue
-        article_number = "" if pd.isna(raw_article_number) else str(raw_article_number).strip()
-        if article_number.casefold() == "nan":
-            article_number = ""
-        name = "" if pd.isna(raw_name) else str(raw_name).strip()
-        if name.casefold() == "nan":
-            name = ""
 
         products[sku].append(
             Product(
@@ -23,7 +23,6 @@ from .session.shared_sync_status import (
     store_shared_sync_status as _store_shared_sync_status,
 )
 from .services.index_sync import (
-    IndexSyncResult,
     sync_index_options_from_uploaded_hicore as _sync_index_options_from_uploaded_hicore,
 )
 from .services.shared_sync import sync_shared_files as _sync_shared_files
@@ -55,31 +54,25 @@ def main() -> None:
         options=[MENU_COMPARE, MENU_SUPPLIER, MENU_SETTINGS],
     )
 
+    # Bootstrap and the settings page only ever store normalized str names here.
+    excluded_brands: list[str] = st.session_state.get("excluded_brands") or []
+    if selected_menu == MENU_COMPARE:
+        # The compare page uses neither index nor the HiCore name lists.
+        _render_compare_page(excluded_brands=excluded_brands)
+        return
+
     indexed_suppliers, supplier_index_error = _load_suppliers_from_index(_supplier_index_path())
     indexed_brands, brand_index_error = _load_brands_from_index(_brand_index_path())
-
-    if selected_menu == MENU_COMPARE:
-        index_sync_result = IndexSyncResult(
-            supplier_options=indexed_suppliers,
-            brand_options=indexed_brands,
-            new_supplier_names=[],
-            new_brand_names=[],
-            hicore_missing_brand_column=False,
-            warning_message=None,
-        )
-    else:
-        index_sync_result = _sync_index_options_from_uploaded_hicore(
-            indexed_suppliers=indexed_suppliers,
-            indexed_brands=indexed_brands,
-            stored_hicore_file=_get_stored_file(st.session_state, kind="hicore"),
-        )
+    stored_hicore_file = _get_stored_file(st.session_state, kind="hicore")
+    index_sync_result = _sync_index_options_from_uploaded_hicore(
+        indexed_suppliers=indexed_suppliers,
+        indexed_brands=indexed_brands,
+        stored_hicore_file=stored_hicore_file,
+    )
     if index_sync_result.warning_message:
         st.warning(index_sync_result.warning_message)
 
-    excluded_brands = [str(name) for name in st.session_state.get("excluded_brands", [])]
-    if selected_menu == MENU_COMPARE:
-        _render_compare_page(excluded_brands=excluded_brands)
-    elif selected_menu == MENU_SUPPLIER:
+    if selected_menu == MENU_SUPPLIER:
         _render_supplier_page(
             supplier_options=index_sync_result.supplier_options,
             supplier_index_error=supplier_index_error,
@@ -91,6 +84,7 @@ def main() -> None:
             brand_options=index_sync_result.brand_options,
             brand_index_error=brand_index_error,
             new_brand_names=index_sync_result.new_brand_names,
+            current_hicore=stored_hicore_file,
             hicore_missing_brand_column=index_sync_result.hicore_missing_brand_column,
         )
 
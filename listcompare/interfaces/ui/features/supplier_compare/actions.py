@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
 from typing import Optional
 
@@ -16,9 +17,12 @@ from listcompare.core.suppliers.profile import (
     matches_profile_output_format as _matches_profile_output_format,
     missing_profile_source_columns as _missing_profile_source_columns,
 )
+from ...common import SupplierUiResult
+from ...compute_shared import ProgressCallback
 from ...io.uploads import _read_supplier_upload
 from ...shared.presentation import build_progress_updater as _build_progress_updater
 from ...services.supplier_compute import compute_supplier_result as _compute_supplier_result
+from ...session.file_inputs import stored_file_digest as _stored_file_digest
 from ...session.navigation import rerun as _rerun
 from ...session.run_state import (
     clear_supplier_prepare_state as _clear_supplier_prepare_state,
@@ -31,6 +35,42 @@ from .prepare import (
 from .prepare_state import _store_prepared_supplier_df
 
 
+def _frame_digest(df: pd.DataFrame) -> str:
+    # st.cache_data only samples frames past 50k rows, so conflict choices that change a
+    # single row could hit a stale entry; this digest covers every cell and the labels.
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+# Re-running the comparison with an unchanged HiCore upload, prepared supplier file and
+# exclusions returns the stored result. The prepared frame is keyed by _frame_digest
+# because conflict choices can change it without changing the prepare signature.
+@st.cache_data(show_spinner=False, max_entries=2)
+def _cached_supplier_result(
+    hicore_file_name: str,
+    hicore_digest: str,
+    supplier_name: str,
+    supplier_digest: str,
+    excluded_brands: tuple[str, ...],
+    profile_excluded_normalized_skus: tuple[str, ...],
+    _hicore_bytes: bytes,
+    _supplier_df: pd.DataFrame,
+    _progress_callback: Optional[ProgressCallback] = None,
+) -> SupplierUiResult:
+    return _compute_supplier_result(
+        hicore_file_name=hicore_file_name,
+        hicore_bytes=_hicore_bytes,
+        supplier_name=supplier_name,
+        supplier_df=_supplier_df,
+        excluded_brands=list(excluded_brands),
+        profile_excluded_normalized_skus=frozenset(profile_excluded_normalized_skus),
+        hicore_digest=hicore_digest,
+        progress_callback=_progress_callback,
+    )
+
+
 @dataclass(frozen=True)
 class UploadedSupplierEvaluation:
     df_supplier_uploaded: Optional[pd.DataFrame]
@@ -60,7 +100,11 @@ def evaluate_uploaded_supplier_file(
     supplier_file_name = str(supplier_file["name"])  # type: ignore[index]
     supplier_bytes = supplier_file["bytes"]  # type: ignore[index]
     try:
-        df_supplier_uploaded = _read_supplier_upload(supplier_file_name, supplier_bytes)
+        df_supplier_uploaded = _read_supplier_upload(
+            supplier_file_name,
+            supplier_bytes,
+            data_digest=_stored_file_digest(supplier_file),
+        )
     except Exception as exc:
         return UploadedSupplierEvaluation(
             df_supplier_uploaded=None,
@@ -119,6 +163,7 @@ def build_prepare_signature(
         supplier_name=selected_supplier_name,
         supplier_file_name=str(supplier_file["name"]),  # type: ignore[index]
         supplier_bytes=supplier_file["bytes"],  # type: ignore[index]
+        supplier_file_digest=_stored_file_digest(supplier_file),
         profile_mapping=profile_mapping,
         profile_composite_fields=profile_composite_fields,
         profile_filters=profile_filters,
@@ -248,14 +293,18 @@ def handle_run_supplier_compare(
     update_progress, clear_progress = _build_progress_updater(label="Leverantörsjämförelse")
     update_progress(0.0, "Startar")
     try:
-        result = _compute_supplier_result(
-            hicore_file_name=str(hicore_file["name"]),  # type: ignore[index]
-            hicore_bytes=hicore_file["bytes"],  # type: ignore[index]
-            supplier_name=selected_supplier_name,
-            supplier_df=prepared_supplier_df,
-            excluded_brands=[str(name) for name in excluded_brands],
-            profile_excluded_normalized_skus=set(profile_excluded_normalized_skus),
-            progress_callback=update_progress,
+        hicore_bytes = hicore_file["bytes"]  # type: ignore[index]
+        result = _cached_supplier_result(
+            str(hicore_file["name"]),  # type: ignore[index]
+            _stored_file_digest(hicore_file),
+            selected_supplier_name,
+            _frame_digest(prepared_supplier_df),
+            tuple(excluded_brands),
+            # Sorted so equal sets always hash the same regardless of iteration order.
+            tuple(sorted(profile_excluded_normalized_skus)),
+            hicore_bytes,
+            prepared_supplier_df,
+            _progress_callback=update_progress,
         )
         update_progress(1.0, "Klar")
         st.session_state["supplier_ui_result"] = result
@@ -17,6 +17,7 @@ def _supplier_compare_export_file_name(*, supplier_name: str, label: str) -> str
     return f"{safe_supplier}_{safe_label}.xlsx"
 
 
+@st.fragment
 def _render_supplier_results(result: SupplierUiResult, *, supplier_name: str) -> None:
     review_label = "SKU/Artikelnummer-diff"
 
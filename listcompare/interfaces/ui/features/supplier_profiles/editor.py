@@ -20,7 +20,10 @@ from ...runtime_paths import (
     supplier_index_path as _supplier_index_path,
     supplier_transform_profiles_path as _supplier_transform_profiles_path,
 )
-from ...session.file_inputs import render_file_input as _render_file_input
+from ...session.file_inputs import (
+    render_file_input as _render_file_input,
+    stored_file_digest as _stored_file_digest,
+)
 from ...session.navigation import rerun as _rerun
 from ...session.profile_state import (
     delete_supplier_transform_profile as _delete_supplier_transform_profile,
@@ -201,7 +204,11 @@ def _render_supplier_profile_editor(
     supplier_file_name = str(supplier_file["name"])  # type: ignore[index]
     supplier_bytes = supplier_file["bytes"]  # type: ignore[index]
     try:
-        df_supplier = _read_supplier_upload(supplier_file_name, supplier_bytes)
+        df_supplier = _read_supplier_upload(
+            supplier_file_name,
+            supplier_bytes,
+            data_digest=_stored_file_digest(supplier_file),
+        )
     except Exception as exc:
         st.error(f"Kunde inte l\u00e4sa leverant\u00f6rsfilen: {exc}")
         return
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import pandas as pd
@@ -268,11 +269,23 @@ def supplier_profile_file_messages(
     return messages
 
 
+@lru_cache(maxsize=4)
+def _folded_supplier_names(names: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(str(name).casefold() for name in names)
+
+
 def filter_supplier_names(names: list[str], query: str) -> list[str]:
     normalized_query = str(query).strip().casefold()
     if normalized_query == "":
         return list(names)
-    return [name for name in names if normalized_query in str(name).casefold()]
+    # Every keystroke in the search box reruns this over the same lists; the folded names
+    # are reused until the list itself changes.
+    names_key = tuple(names)
+    return [
+        name
+        for name, folded_name in zip(names_key, _folded_supplier_names(names_key))
+        if normalized_query in folded_name
+    ]
 
 
 def selected_dataframe_row_index(selection_event: object) -> Optional[int]:
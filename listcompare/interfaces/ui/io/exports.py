@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import codecs
+import csv
 import io
+import os
 from decimal import Decimal, InvalidOperation
 
 import pandas as pd
@@ -13,12 +16,23 @@ DECIMAL_NUMBER_FORMAT = "0.################"
 
 
 def _sku_csv_bytes(skus: list[str]) -> bytes:
-    df = pd.DataFrame({"Art.m\u00e4rkning": skus})
-    return df.to_csv(sep=";", index=False).encode("utf-8-sig")
+    # A single text column needs no DataFrame; the csv module is what to_csv writes through
+    # anyway, with the same quoting and line terminator.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=";", lineterminator=os.linesep)
+    writer.writerow(("Art.m\u00e4rkning",))
+    writer.writerows((sku,) for sku in skus)
+    return buffer.getvalue().encode("utf-8-sig")
 
 
 def _df_csv_bytes(df: pd.DataFrame, *, sep: str = ";") -> bytes:
-    return df.to_csv(sep=sep, index=False).encode("utf-8-sig")
+    # Encode while writing instead of building the whole CSV as str and encoding it afterwards.
+    # The BOM is written once up front so the body goes through the C utf-8 encoder rather
+    # than the pure-Python utf-8-sig incremental encoder.
+    buffer = io.BytesIO()
+    buffer.write(codecs.BOM_UTF8)
+    df.to_csv(buffer, sep=sep, index=False, encoding="utf-8")
+    return buffer.getvalue()
 
 
 def _df_excel_bytes(df: pd.DataFrame, *, sheet_name: str = "Sheet1") -> bytes:
@@ -26,21 +40,35 @@ def _df_excel_bytes(df: pd.DataFrame, *, sheet_name: str = "Sheet1") -> bytes:
     with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
         df.to_excel(writer, index=False, sheet_name=sheet_name)
         worksheet = writer.book[sheet_name]
-        for column_cells in worksheet.iter_cols(min_row=1, max_row=worksheet.max_row):
-            header_value = column_cells[0].value
+        for column_index, header_value in enumerate(df.columns, start=1):
             header_text = str(header_value).strip()
-            for cell in column_cells[1:]:
+            is_text_column = header_text in TEXT_FORMAT_HEADERS
+            if not is_text_column and header_text not in DECIMAL_FORMAT_HEADERS:
+                # Only the formatted columns need a cell walk.
+                continue
+            # Price columns repeat the same few texts, so each one is parsed once.
+            decimal_values: dict[object, int | float | None] = {}
+            for (cell,) in worksheet.iter_rows(
+                min_row=2,
+                max_row=worksheet.max_row,
+                min_col=column_index,
+                max_col=column_index,
+            ):
                 if cell.value is None:
                     continue
-                if header_text in TEXT_FORMAT_HEADERS:
+                if is_text_column:
                     cell.number_format = "@"
                     continue
-                if header_text in DECIMAL_FORMAT_HEADERS:
-                    decimal_value = _coerce_decimal_cell_value(cell.value)
-                    if decimal_value is None:
-                        continue
-                    cell.value = decimal_value
-                    cell.number_format = DECIMAL_NUMBER_FORMAT
+                try:
+                    decimal_value = decimal_values[cell.value]
+                except KeyError:
+                    decimal_value = decimal_values[cell.value] = _coerce_decimal_cell_value(
+                        cell.value
+                    )
+                if decimal_value is None:
+                    continue
+                cell.value = decimal_value
+                cell.number_format = DECIMAL_NUMBER_FORMAT
     return buffer.getvalue()
 
 
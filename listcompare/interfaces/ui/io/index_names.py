@@ -1,20 +1,40 @@
 from __future__ import annotations
 
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
 import streamlit as st
 
 from ..persistence import index_store as _index_store
-from .uploads import _read_hicore_name_columns
+from ..persistence.text_files import file_signature as _file_signature
+from .uploads import _read_hicore_name_columns, _upload_digest
 
 
 def _normalize_supplier_names(raw_names: list[str]) -> list[str]:
     return _index_store.normalize_names(raw_names)
 
 
+# The index files change rarely, so the parse is keyed on the file's mtime and size;
+# any save rewrites the file and thereby invalidates the cached entry.
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_suppliers_from_index_cached(
+    path_str: str,
+    file_key: Optional[tuple[int, int]],
+) -> tuple[list[str], Optional[str]]:
+    return _index_store.load_suppliers_from_index(Path(path_str))
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_brands_from_index_cached(
+    path_str: str,
+    file_key: Optional[tuple[int, int]],
+) -> tuple[list[str], Optional[str]]:
+    return _index_store.load_brands_from_index(Path(path_str))
+
+
 def _load_suppliers_from_index(path: Path) -> tuple[list[str], Optional[str]]:
-    return _index_store.load_suppliers_from_index(path)
+    return _load_suppliers_from_index_cached(str(path), _file_signature(path))
 
 
 def _save_suppliers_to_index(path: Path, suppliers: list[str]) -> None:
@@ -22,7 +42,7 @@ def _save_suppliers_to_index(path: Path, suppliers: list[str]) -> None:
 
 
 def _load_brands_from_index(path: Path) -> tuple[list[str], Optional[str]]:
-    return _index_store.load_brands_from_index(path)
+    return _load_brands_from_index_cached(str(path), _file_signature(path))
 
 
 def _save_brands_to_index(path: Path, brands: list[str]) -> None:
@@ -30,18 +50,16 @@ def _save_brands_to_index(path: Path, brands: list[str]) -> None:
 
 
 def _merge_supplier_lists(existing: list[str], discovered: list[str]) -> tuple[list[str], list[str]]:
+    # Fold both lists into one dict in a single pass each; only the results are sorted.
     by_folded: dict[str, str] = {}
-    for name in _normalize_supplier_names(existing):
-        by_folded[name.casefold()] = name
-
-    new_names: list[str] = []
-    for name in _normalize_supplier_names(discovered):
-        folded = name.casefold()
-        if folded not in by_folded:
-            by_folded[folded] = name
-            new_names.append(name)
-
-    merged = sorted(by_folded.values(), key=lambda value: value.casefold())
+    _index_store.unique_names_by_folded(existing, by_folded)
+    known_count = len(by_folded)
+    _index_store.unique_names_by_folded(discovered, by_folded)
+
+    # Dicts keep insertion order, so the keys past ``known_count`` are the new names; they
+    # are already casefolded and sort without folding again.
+    new_names = [by_folded[folded] for folded in sorted(islice(by_folded, known_count, None))]
+    merged = _index_store.sorted_by_folded(by_folded)
     return merged, new_names
 
 
@@ -49,13 +67,27 @@ def _merge_brand_lists(existing: list[str], discovered: list[str]) -> tuple[list
     return _merge_supplier_lists(existing, discovered)
 
 
-@st.cache_data(show_spinner=False)
 def _load_names_from_uploaded_hicore(
     uploaded_name: str,
     uploaded_bytes: bytes,
+    *,
+    uploaded_digest: Optional[str] = None,
+) -> tuple[list[str], list[str], bool, bool]:
+    return _load_names_from_uploaded_hicore_cached(
+        uploaded_name,
+        uploaded_digest or _upload_digest(uploaded_bytes),
+        uploaded_bytes,
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_names_from_uploaded_hicore_cached(
+    uploaded_name: str,
+    uploaded_digest: str,
+    _uploaded_bytes: bytes,
 ) -> tuple[list[str], list[str], bool, bool]:
     supplier_names, brand_names, has_supplier_column, has_brand_column = (
-        _read_hicore_name_columns(uploaded_name, uploaded_bytes)
+        _read_hicore_name_columns(uploaded_name, _uploaded_bytes, data_digest=uploaded_digest)
     )
     return (
         _normalize_supplier_names(supplier_names),
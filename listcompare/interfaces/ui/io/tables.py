@@ -1,39 +1,45 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Optional
 
+import numpy as np
 import pandas as pd
+from pandas.io.formats.style import Styler
 
 from ....core.comparison import SupplierArticleNumberReviewMatch
 from ....core.products.product_diff import ProductMap, normalize_sku
+from ....core.products.product_normalization import normalize_sku_values
 from ....core.products.product_schema import HICORE_COLUMNS, Product
 
 
+_PRODUCT_FIELDS = ("sku", "name", "stock", "price", "supplier", "source")
+# One getter per column lets map() walk the products in C rather than a getattr per cell.
+_PRODUCT_FIELD_GETTERS = tuple((field, attrgetter(field)) for field in _PRODUCT_FIELDS)
+
+
+def _product_columns(products: list[Product]) -> dict[str, list[str]]:
+    return {field: list(map(get_field, products)) for field, get_field in _PRODUCT_FIELD_GETTERS}
+
+
+def _product_sort_key(product: Product) -> tuple[str, str]:
+    raw_sku = str(product.sku).strip()
+    return normalize_sku(raw_sku), raw_sku
+
+
 def _product_map_to_df(product_map: ProductMap) -> pd.DataFrame:
-    rows: list[dict[str, str]] = []
+    keyed_products: list[tuple[str, Product]] = []
     for key in sorted(product_map.keys(), key=lambda value: (normalize_sku(str(value)), str(value))):
-        products = product_map[key]
-        for product in products:
-            rows.append(
-                {
-                    "map_key": key,
-                    "sku": product.sku,
-                    "name": product.name,
-                    "stock": product.stock,
-                    "price": product.price,
-                    "supplier": product.supplier,
-                    "source": product.source,
-                }
-            )
-
-    if not rows:
-        return pd.DataFrame(columns=["map_key", "sku", "name", "stock", "price", "supplier", "source"])
-    df = pd.DataFrame(rows)
-    df["_lc_sort_sku"] = df["sku"].map(lambda value: normalize_sku(str(value).strip()))
-    df["_lc_sort_sku_raw"] = df["sku"].map(lambda value: str(value).strip())
-    df = df.sort_values(by=["_lc_sort_sku", "_lc_sort_sku_raw"], kind="stable")
-    df = df.drop(columns=["_lc_sort_sku", "_lc_sort_sku_raw"])
-    return df.reset_index(drop=True)
+        keyed_products.extend((key, product) for product in product_map[key])
+
+    if not keyed_products:
+        return pd.DataFrame(columns=["map_key", *_PRODUCT_FIELDS])
+    # A stable sort of the rows before building the frame gives the same order as
+    # sorting helper columns in pandas, without inserting, sorting and dropping them.
+    keyed_products.sort(key=lambda item: _product_sort_key(item[1]))
+    map_keys = [key for key, _product in keyed_products]
+    products = [product for _key, product in keyed_products]
+    return pd.DataFrame({"map_key": map_keys, **_product_columns(products)})
 
 
 def _mismatch_map_to_df(
@@ -41,10 +47,9 @@ def _mismatch_map_to_df(
     *,
     preferred_side_order: tuple[str, ...] = ("hicore", "magento", "supplier"),
 ) -> pd.DataFrame:
-    rows: list[dict[str, str]] = []
+    ranked_products: list[tuple[str, int, Product]] = []
     side_rank = {side_name: rank for rank, side_name in enumerate(preferred_side_order)}
-    for normalized_sku in sorted(mismatch_map.keys(), key=lambda value: (normalize_sku(str(value)), str(value))):
-        sides = mismatch_map[normalized_sku]
+    for normalized_sku, sides in mismatch_map.items():
         ordered_side_names: list[str] = [
             side_name for side_name in preferred_side_order if side_name in sides
         ]
@@ -52,75 +57,61 @@ def _mismatch_map_to_df(
             if side_name not in ordered_side_names:
                 ordered_side_names.append(side_name)
         for side_name in ordered_side_names:
-            for product in sides.get(side_name, []):
-                rows.append(
-                    {
-                        "normalized_sku": normalized_sku,
-                        "_lc_side_rank": side_rank.get(str(side_name), len(side_rank)),
-                        "sku": product.sku,
-                        "name": product.name,
-                        "stock": product.stock,
-                        "price": product.price,
-                        "supplier": product.supplier,
-                        "source": product.source,
-                    }
-                )
-
-    if not rows:
-        return pd.DataFrame(
-            columns=["normalized_sku", "sku", "name", "stock", "price", "supplier", "source"]
-        )
-    df = pd.DataFrame(rows)
-    df = df.sort_values(
-        by=["normalized_sku", "_lc_side_rank", "sku"],
-        kind="stable",
+            rank = side_rank.get(str(side_name), len(side_rank))
+            ranked_products.extend((normalized_sku, rank, product) for product in sides[side_name])
+
+    if not ranked_products:
+        return pd.DataFrame(columns=["normalized_sku", *_PRODUCT_FIELDS])
+    # Sort the rows in Python and build each column once, instead of adding a rank column
+    # to sort on in pandas and dropping it again.
+    ranked_products.sort(key=lambda item: (item[0], item[1], item[2].sku))
+    return pd.DataFrame(
+        {
+            "normalized_sku": [normalized_sku for normalized_sku, _rank, _product in ranked_products],
+            **_product_columns([product for _sku, _rank, product in ranked_products]),
+        }
     )
-    df = df.drop(columns=["_lc_side_rank"])
-    return df.reset_index(drop=True)
 
 
 def _article_number_review_matches_to_df(
     review_matches: tuple[SupplierArticleNumberReviewMatch, ...],
 ) -> pd.DataFrame:
-    rows: list[dict[str, str]] = []
+    normalized_article_numbers: list[str] = []
+    article_numbers: list[str] = []
+    side_ranks: list[int] = []
+    products: list[Product] = []
     side_rank = {"hicore": 0, "supplier": 1}
     for match in review_matches:
-        for side_name, products in (
-            ("hicore", list(match.hicore_rows)),
-            ("supplier", list(match.supplier_rows)),
+        for side_name, side_products in (
+            ("hicore", match.hicore_rows),
+            ("supplier", match.supplier_rows),
         ):
-            for product in products:
-                rows.append(
-                    {
-                        "normalized_article_number": match.normalized_article_number,
-                        "article_number": (
-                            str(product.article_number).strip() or str(match.article_number).strip()
-                        ),
-                        "_lc_side_rank": side_rank.get(str(side_name), len(side_rank)),
-                        "sku": product.sku,
-                        "name": product.name,
-                        "stock": product.stock,
-                        "price": product.price,
-                        "supplier": product.supplier,
-                        "source": product.source,
-                    }
+            rank = side_rank.get(str(side_name), len(side_rank))
+            for product in side_products:
+                normalized_article_numbers.append(match.normalized_article_number)
+                article_numbers.append(
+                    str(product.article_number).strip() or str(match.article_number).strip()
                 )
+                side_ranks.append(rank)
+                products.append(product)
 
-    if not rows:
+    if not products:
         return pd.DataFrame(
             columns=[
                 "normalized_article_number",
                 "article_number",
-                "sku",
-                "name",
-                "stock",
-                "price",
-                "supplier",
-                "source",
+                *_PRODUCT_FIELDS,
             ]
         )
 
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame(
+        {
+            "normalized_article_number": normalized_article_numbers,
+            "article_number": article_numbers,
+            "_lc_side_rank": side_ranks,
+            **_product_columns(products),
+        }
+    )
     df = df.sort_values(
         by=["normalized_article_number", "_lc_side_rank", "sku"],
         kind="stable",
@@ -129,24 +120,42 @@ def _article_number_review_matches_to_df(
     return df.reset_index(drop=True)
 
 
+def _stripe_row_css(group_keys: Optional[pd.Series], row_count: int) -> np.ndarray:
+    colors = ("#f3f3f3", "#ffffff")
+    if group_keys is not None:
+        keys = normalize_sku_values(group_keys).to_numpy()
+        # A new group starts wherever a key differs from the row above it.
+        group_starts = np.empty(len(keys), dtype=bool)
+        group_starts[:1] = True
+        np.not_equal(keys[1:], keys[:-1], out=group_starts[1:])
+        group_index = np.cumsum(group_starts) - 1
+    else:
+        group_index = np.arange(row_count)
+    return np.where(
+        (group_index & 1) == 0,
+        f"background-color: {colors[0]}",
+        f"background-color: {colors[1]}",
+    )
+
+
 def _style_stock_mismatch_df(
     df: pd.DataFrame,
     *,
     group_values: Optional[list[object]] = None,
-):
-    if df.empty:
+) -> pd.DataFrame | Styler:
+    if df.size > pd.get_option("styler.render.max_elements"):
+        # Streamlit refuses to render any Styler past this many cells, so large tables are
+        # shown as the plain frame without stripes.
+        return df
+
+    if len(df) <= 1:
+        # Nothing to alternate with, so skip the CSS frame and the per-cell style pass.
         return df.style
 
-    colors = ("#f3f3f3", "#ffffff")
-    row_colors: list[str] = []
-    normalized_group_values: Optional[list[str]] = None
+    group_keys: Optional[pd.Series] = None
     if group_values is not None and len(group_values) == len(df):
-        normalized_group_values = [
-            normalize_sku("" if pd.isna(value) else str(value))
-            for value in group_values
-        ]
+        group_keys = pd.Series(group_values, dtype=object)
     else:
-        group_column: Optional[str] = None
         for candidate in (
             "normalized_sku",
             "normalized_article_number",
@@ -155,27 +164,17 @@ def _style_stock_mismatch_df(
             HICORE_COLUMNS["sku"],
         ):
             if candidate in df.columns:
-                group_column = candidate
+                group_keys = df[candidate].reset_index(drop=True)
                 break
-        if group_column is not None:
-            normalized_group_values = [
-                normalize_sku("" if pd.isna(value) else str(value))
-                for value in df[group_column].tolist()
-            ]
-
-    if normalized_group_values is not None:
-        previous_key: Optional[str] = None
-        group_index = -1
-        for current_key in normalized_group_values:
-            if previous_key is None or current_key != previous_key:
-                group_index += 1
-                previous_key = current_key
-            row_colors.append(colors[group_index % 2])
-    else:
-        row_colors = [colors[idx % 2] for idx in range(len(df))]
 
-    index_to_color = dict(zip(df.index.tolist(), row_colors))
-    return df.style.apply(
-        lambda row: [f"background-color: {index_to_color.get(row.name, colors[1])}"] * len(row),
-        axis=1,
+    row_css = _stripe_row_css(group_keys, len(df)).astype(object)
+    # One frame of CSS strings styled in a single call instead of a Python callback per row.
+    # The per-row column is broadcast across the columns as a read-only view; converting it
+    # to object first keeps pandas from copying every cell of the fixed-width string array.
+    styles = pd.DataFrame(
+        np.broadcast_to(row_css[:, None], (len(df), len(df.columns))),
+        index=df.index,
+        columns=df.columns,
+        copy=False,
     )
+    return df.style.apply(lambda _frame: styles, axis=None)
@@ -1,18 +1,51 @@
 from __future__ import annotations
 
+import codecs
 import csv
+import hashlib
 import io
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 from openpyxl import load_workbook
 
+from ....core.products.product_diff import ProductMap
+from ....core.products.product_mapping import build_product_map
 from ....core.products.product_schema import HICORE_COLUMNS
 from ..common import CSV_ENCODINGS
 
+_UTF8_BOM = b"\xef\xbb\xbf"
+_ENCODING_SNIFF_BYTES = 64 * 1024
+# The five bytes cp1252 leaves unassigned; a memchr scan is far cheaper than a failed parse.
+_CP1252_UNDEFINED_BYTES = (b"\x81", b"\x8d", b"\x8f", b"\x90", b"\x9d")
+
+
+def _looks_like_utf8(sample: bytes) -> bool:
+    # The incremental decoder tolerates a multi-byte sequence cut off at the sample boundary.
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _csv_encodings_for(data: bytes) -> tuple[str, ...]:
+    # A UTF-8 BOM settles the encoding; retrying legacy codecs would only repeat a failed parse.
+    if data.startswith(_UTF8_BOM):
+        return ("utf-8-sig",)
+    # Without a BOM utf-8-sig and utf-8 decode identically, so one UTF-8 attempt is enough.
+    utf8_encodings = ("utf-8-sig",) if _looks_like_utf8(data[:_ENCODING_SNIFF_BYTES]) else ()
+    legacy_encodings = tuple(enc for enc in CSV_ENCODINGS if not enc.startswith("utf-8"))
+    if any(byte in data for byte in _CP1252_UNDEFINED_BYTES):
+        # cp1252 is certain to fail on these bytes; latin1 decodes anything.
+        legacy_encodings = tuple(enc for enc in legacy_encodings if enc != "cp1252")
+    return utf8_encodings + legacy_encodings
+
 
 def _uploaded_csv_to_df(
     data: bytes,
@@ -22,41 +55,84 @@ def _uploaded_csv_to_df(
     extra_read_csv_kwargs: Optional[dict[str, object]] = None,
 ) -> pd.DataFrame:
     last_err: Optional[Exception] = None
-    for enc in CSV_ENCODINGS:
+    for enc in _csv_encodings_for(data):
         try:
-            text = data.decode(enc)
             kwargs: dict[str, object] = {
                 "sep": sep,
                 "dtype": str,
                 "index_col": False,
+                "encoding": enc,
             }
             if engine is not None:
                 kwargs["engine"] = engine
             if extra_read_csv_kwargs:
                 kwargs.update(extra_read_csv_kwargs)
-            return pd.read_csv(io.StringIO(text), **kwargs)
+            # Let the parser decode the raw bytes instead of materializing a full str copy first.
+            return pd.read_csv(io.BytesIO(data), **kwargs)
         except UnicodeDecodeError as err:
-            last_err = err
-        except Exception as err:
+            # Only a decode failure is worth another encoding; a parse error would repeat.
             last_err = err
     if last_err is not None:
         raise last_err
     raise UnicodeDecodeError("utf-8", b"", 0, 1, "Unable to decode uploaded CSV")
 
 
+_FALLBACK_CSV_SEPARATORS = (";", ",", "\t", "|")
+_SEPARATOR_SNIFF_LINES = 50
+
+
+def _separator_scores(data: bytes) -> dict[str, tuple[bool, int]]:
+    sample = data[:_ENCODING_SNIFF_BYTES].decode("utf-8", errors="replace")
+    lines = [line for line in sample.splitlines()[:_SEPARATOR_SNIFF_LINES] if line.strip()]
+    if len(lines) > 1 and not sample.endswith(("\n", "\r")):
+        lines = lines[:-1]
+    if not lines:
+        return {}
+
+    scores: dict[str, tuple[bool, int]] = {}
+    for sep in _FALLBACK_CSV_SEPARATORS:
+        counts = [line.count(sep) for line in lines]
+        scores[sep] = (counts[0] > 0 and len(set(counts)) == 1, counts[0])
+    return scores
+
+
+def _ranked_fallback_separators(data: bytes) -> tuple[str, ...]:
+    # Order candidates by how consistently they split the first lines, so the likely
+    # separator is parsed first instead of walking the whole file once per candidate.
+    scores = _separator_scores(data)
+    if not scores:
+        return _FALLBACK_CSV_SEPARATORS
+    return tuple(sorted(_FALLBACK_CSV_SEPARATORS, key=scores.__getitem__, reverse=True))
+
+
+def _unambiguous_csv_separator(data: bytes) -> Optional[str]:
+    consistent = [sep for sep, (is_consistent, _count) in _separator_scores(data).items() if is_consistent]
+    return consistent[0] if len(consistent) == 1 else None
+
+
 def _read_supplier_csv_upload(data: bytes) -> pd.DataFrame:
+    # A separator that alone splits every sampled line evenly is parsed once with the C
+    # engine; anything ambiguous or malformed goes through the sniffing python engine.
+    sniffed_sep = _unambiguous_csv_separator(data)
+    if sniffed_sep is not None:
+        try:
+            return _uploaded_csv_to_df(data, sep=sniffed_sep)
+        except Exception:
+            pass
+
     try:
         return _uploaded_csv_to_df(data, sep=None, engine="python")
     except Exception as first_error:
         fallback_error: Exception = first_error
+        separators = _ranked_fallback_separators(data)
 
-        for sep in (";", ",", "\t", "|"):
+        for sep in separators:
             try:
                 return _uploaded_csv_to_df(data, sep=sep, engine="python")
             except Exception as err:
                 fallback_error = err
 
-        for sep in (";", ",", "\t", "|"):
+        for sep in separators:
             try:
                 return _uploaded_csv_to_df(
                     data,
@@ -92,17 +168,34 @@ def _find_case_insensitive_column(columns: list[object], wanted: str) -> Optiona
     return None
 
 
-def _normalize_integer_like_identifier_text(value: object) -> object:
-    if pd.isna(value):
-        return value
-    text = str(value).strip()
-    if re.fullmatch(r"-?\d+\.0+", text) is None:
-        return value
-    return text.split(".", 1)[0]
+_INTEGER_LIKE_DECIMAL_PATTERN = r"-?\d+\.0+"
+
+
+def _normalize_integer_like_identifier_values(values: pd.Series) -> pd.Series:
+    # Only values with a decimal point can match; finding those with a plain scan first
+    # keeps the strip and regex off the (usually all) identifiers that have none.
+    has_point = np.fromiter(
+        ("." in str(value) for value in values.to_numpy()),
+        dtype=bool,
+        count=len(values),
+    )
+    if not has_point.any():
+        return values
+    candidates = values[has_point]
+    text = candidates.where(candidates.notna(), "").astype(str).str.strip()
+    integer_like = text.str.fullmatch(_INTEGER_LIKE_DECIMAL_PATTERN).to_numpy(dtype=bool)
+    if not integer_like.any():
+        return values
+    normalized = values.astype(object)
+    normalized.iloc[np.flatnonzero(has_point)[integer_like]] = (
+        text[integer_like].str.split(".", n=1).str[0].to_numpy()
+    )
+    return normalized
 
 
 def _normalize_hicore_identifier_columns(df: pd.DataFrame) -> pd.DataFrame:
-    normalized_df = df.copy()
+    # Shallow copy: only the identifier columns are replaced, the rest stay shared.
+    normalized_df = df.copy(deep=False)
     for wanted_column in (
         HICORE_COLUMNS["sku"],
         HICORE_COLUMNS["article_number"],
@@ -111,12 +204,13 @@ def _normalize_hicore_identifier_columns(df: pd.DataFrame) -> pd.DataFrame:
         actual_column = _find_case_insensitive_column(normalized_df.columns.tolist(), wanted_column)
         if actual_column is None:
             continue
-        normalized_df[actual_column] = normalized_df[actual_column].map(
-            _normalize_integer_like_identifier_text
+        normalized_df[actual_column] = _normalize_integer_like_identifier_values(
+            normalized_df[actual_column]
         )
     return normalized_df
 
 
+@lru_cache(maxsize=256)
 def _zero_pad_width_from_excel_number_format(number_format: object) -> Optional[int]:
     text = str(number_format or "").strip()
     if text == "":
@@ -186,17 +280,22 @@ def _best_hicore_sheet_name(data: bytes) -> Optional[str]:
 
 def _read_excel_upload(data: bytes, *, sheet_name: Optional[str] = None) -> pd.DataFrame:
     df = pd.read_excel(io.BytesIO(data), dtype=str, sheet_name=sheet_name or 0)
-    workbook = load_workbook(io.BytesIO(data), data_only=True)
+    # Stream the formats in read-only mode instead of loading every cell object up front.
+    workbook = load_workbook(io.BytesIO(data), data_only=True, read_only=True)
     try:
         worksheet_name = sheet_name or workbook.sheetnames[0]
         worksheet = workbook[worksheet_name]
         repaired_df = df.copy()
-        for row_index in range(len(repaired_df.index)):
-            for column_index in range(len(repaired_df.columns)):
-                cell = worksheet.cell(row=row_index + 2, column=column_index + 1)
+        row_count = len(repaired_df.index)
+        column_count = len(repaired_df.columns)
+        if row_count == 0 or column_count == 0:
+            return repaired_df
+        rows = worksheet.iter_rows(min_row=2, max_row=row_count + 1, max_col=column_count)
+        for row_index, row in enumerate(rows):
+            for column_index, cell in enumerate(row):
                 repaired_value = _formatted_zero_padded_excel_text(
                     cell.value,
-                    cell.number_format,
+                    getattr(cell, "number_format", None),
                 )
                 if repaired_value is None:
                     continue
@@ -206,20 +305,51 @@ def _read_excel_upload(data: bytes, *, sheet_name: Optional[str] = None) -> pd.D
         workbook.close()
 
 
-def _read_supplier_upload(file_name: str, data: bytes) -> pd.DataFrame:
-    return _read_supplier_upload_cached(file_name=file_name, data=data).copy()
+def _upload_digest(data: bytes) -> str:
+    # The cached readers below key on this short digest instead of having st.cache_data
+    # hash the whole payload on every call.
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# The readers take the digest stored with the upload (see store_uploaded_file) and only
+# hash the bytes themselves when a caller has none.
+# st.cache_data unpickles a fresh DataFrame on every hit, so callers may mutate the
+# returned frame without an extra defensive copy.
+def _read_supplier_upload(
+    file_name: str,
+    data: bytes,
+    *,
+    data_digest: Optional[str] = None,
+) -> pd.DataFrame:
+    return _read_supplier_upload_cached(file_name, data_digest or _upload_digest(data), data)
 
 
-def _read_hicore_upload(file_name: str, data: bytes) -> pd.DataFrame:
-    return _read_hicore_upload_cached(file_name=file_name, data=data).copy()
+def _read_hicore_upload(
+    file_name: str,
+    data: bytes,
+    *,
+    data_digest: Optional[str] = None,
+) -> pd.DataFrame:
+    return _read_hicore_upload_cached(file_name, data_digest or _upload_digest(data), data)
+
+
+def _read_hicore_product_map(
+    file_name: str,
+    data: bytes,
+    *,
+    data_digest: Optional[str] = None,
+) -> ProductMap:
+    return _read_hicore_product_map_cached(file_name, data_digest or _upload_digest(data), data)
 
 
 def _read_hicore_name_columns(
     file_name: str,
     data: bytes,
+    *,
+    data_digest: Optional[str] = None,
 ) -> tuple[list[str], list[str], bool, bool]:
     supplier_names, brand_names, has_supplier_column, has_brand_column = (
-        _read_hicore_name_columns_cached(file_name=file_name, data=data)
+        _read_hicore_name_columns_cached(file_name, data_digest or _upload_digest(data), data)
     )
     return (
         list(supplier_names),
@@ -230,7 +360,8 @@ def _read_hicore_name_columns(
 
 
 @st.cache_data(show_spinner=False)
-def _read_supplier_upload_cached(file_name: str, data: bytes) -> pd.DataFrame:
+def _read_supplier_upload_cached(file_name: str, data_digest: str, _data: bytes) -> pd.DataFrame:
+    data = _data
     suffix = Path(file_name).suffix.lower()
     if suffix == ".csv":
         return _read_supplier_csv_upload(data)
@@ -239,8 +370,11 @@ def _read_supplier_upload_cached(file_name: str, data: bytes) -> pd.DataFrame:
     raise ValueError(f"Unsupported supplier file type: {file_name}")
 
 
-@st.cache_data(show_spinner=False)
-def _read_hicore_upload_cached(file_name: str, data: bytes) -> pd.DataFrame:
+# The one HiCore parse shared by the compare run, the supplier product map and the
+# sidebar name lists; two entries bound memory when files are swapped.
+@st.cache_data(show_spinner=False, max_entries=2)
+def _read_hicore_upload_cached(file_name: str, data_digest: str, _data: bytes) -> pd.DataFrame:
+    data = _data
     suffix = Path(file_name).suffix.lower()
     if suffix == ".csv":
         return _normalize_hicore_identifier_columns(_read_hicore_csv_upload(data))
@@ -256,12 +390,34 @@ def _read_hicore_upload_cached(file_name: str, data: bytes) -> pd.DataFrame:
     raise ValueError(f"Unsupported HiCore file type: {file_name}")
 
 
+# Keeps the HiCore product map across supplier runs against the same upload; two entries
+# bound memory when files are swapped.
+@st.cache_data(show_spinner=False, max_entries=2)
+def _read_hicore_product_map_cached(file_name: str, data_digest: str, _data: bytes) -> ProductMap:
+    return build_product_map(
+        _read_hicore_upload_cached(file_name, data_digest, _data),
+        source="hicore",
+        columns=HICORE_COLUMNS,
+    )
+
+
 def _raw_text_or_empty(value: object) -> str:
     if pd.isna(value):
         return ""
     return str(value).strip()
 
 
+def _non_empty_column_texts(values: pd.Series) -> list[str]:
+    # Drop blanks and case-insensitive repeats in pandas; the first spelling per name wins,
+    # matching normalize_names, so only distinct names cross into Python. Exact repeats go
+    # first in a hash pass so the string methods only see each distinct text once.
+    distinct = pd.unique(values.dropna().astype(str).to_numpy())
+    texts = pd.Series(distinct, dtype=object).str.strip()
+    folded = texts.str.casefold()
+    keep = texts.ne("") & folded.ne("nan") & ~folded.duplicated()
+    return texts[keep].tolist()
+
+
 def _extract_hicore_name_columns_from_excel(
     data: bytes,
     *,
@@ -291,22 +447,25 @@ def _extract_hicore_name_columns_from_excel(
             ):
                 brand_index = index
 
-        supplier_names: list[str] = []
-        brand_names: list[str] = []
-        for row in worksheet.iter_rows(min_row=2, values_only=True):
-            row_values = list(row)
-            if supplier_index is not None and supplier_index < len(row_values):
-                supplier_value = _raw_text_or_empty(row_values[supplier_index])
-                if supplier_value != "":
-                    supplier_names.append(supplier_value)
-            if brand_index is not None and brand_index < len(row_values):
-                brand_value = _raw_text_or_empty(row_values[brand_index])
-                if brand_value != "":
-                    brand_names.append(brand_value)
+        raw_suppliers: list[object] = []
+        raw_brands: list[object] = []
+        wanted_indexes = [index for index in (supplier_index, brand_index) if index is not None]
+        if wanted_indexes:
+            # Only read cells up to the right-most name column instead of whole rows; the
+            # raw cells are cleaned column-wise below rather than one pd.isna call per cell.
+            for row in worksheet.iter_rows(
+                min_row=2,
+                max_col=max(wanted_indexes) + 1,
+                values_only=True,
+            ):
+                if supplier_index is not None and supplier_index < len(row):
+                    raw_suppliers.append(row[supplier_index])
+                if brand_index is not None and brand_index < len(row):
+                    raw_brands.append(row[brand_index])
 
         return (
-            supplier_names,
-            brand_names,
+            _non_empty_column_texts(pd.Series(raw_suppliers, dtype=object)),
+            _non_empty_column_texts(pd.Series(raw_brands, dtype=object)),
             supplier_index is not None,
             brand_index is not None,
         )
@@ -317,26 +476,29 @@ def _extract_hicore_name_columns_from_excel(
 @st.cache_data(show_spinner=False)
 def _read_hicore_name_columns_cached(
     file_name: str,
-    data: bytes,
+    data_digest: str,
+    _data: bytes,
 ) -> tuple[list[str], list[str], bool, bool]:
+    data = _data
     suffix = Path(file_name).suffix.lower()
     if suffix == ".csv":
-        df_hicore = _read_hicore_csv_upload(data)
+        # Share the cached full parse with the compare pipeline instead of parsing again.
+        df_hicore = _read_hicore_upload_cached(file_name, data_digest, data)
         supplier_col = HICORE_COLUMNS["supplier"]
         brand_col = HICORE_COLUMNS.get("brand")
         supplier_names = (
-            [_raw_text_or_empty(value) for value in df_hicore[supplier_col].tolist()]
+            _non_empty_column_texts(df_hicore[supplier_col])
             if supplier_col in df_hicore.columns
             else []
         )
         brand_names = (
-            [_raw_text_or_empty(value) for value in df_hicore[brand_col].tolist()]
+            _non_empty_column_texts(df_hicore[brand_col])
             if brand_col and brand_col in df_hicore.columns
             else []
         )
         return (
-            [value for value in supplier_names if value != ""],
-            [value for value in brand_names if value != ""],
+            supplier_names,
+            brand_names,
             supplier_col in df_hicore.columns,
             bool(brand_col and brand_col in df_hicore.columns),
         )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Optional
+
 import streamlit as st
 
 from ..common import (
@@ -9,6 +11,7 @@ from ..common import (
     CompareUiResult,
     WebOrderCompareUiResult,
 )
+from ..compute_shared import ProgressCallback
 from ..io.tables import _style_stock_mismatch_df
 from ..shared.presentation import (
     build_progress_updater as _build_progress_updater,
@@ -18,28 +21,52 @@ from ..services.compare_compute import (
     compute_compare_result as _compute_compare_result,
     compute_web_order_compare_result as _compute_web_order_compare_result,
 )
-from ..session.file_inputs import render_file_input as _render_file_input
+from ..session.file_inputs import (
+    render_file_input as _render_file_input,
+    stored_file_digest as _stored_file_digest,
+)
+
+
+# Re-running with the same uploads and exclusions returns the stored result instead of
+# re-parsing and re-comparing; two entries bound memory when files are swapped.
+@st.cache_data(show_spinner=False, max_entries=2)
+def _cached_compare_result(
+    hicore_file_name: str,
+    hicore_digest: str,
+    magento_digest: str,
+    excluded_brands: tuple[str, ...],
+    _hicore_bytes: bytes,
+    _magento_bytes: bytes,
+    _progress_callback: Optional[ProgressCallback] = None,
+) -> CompareUiResult:
+    return _compute_compare_result(
+        hicore_file_name=hicore_file_name,
+        hicore_bytes=_hicore_bytes,
+        magento_bytes=_magento_bytes,
+        excluded_brands=list(excluded_brands),
+        hicore_digest=hicore_digest,
+        progress_callback=_progress_callback,
+    )
+
+
+_EXCLUDED_BRANDS_PREVIEW_LIMIT = 8
 
 
+def _excluded_brands_preview(excluded_brands: list[str]) -> str:
+    # Only the shown names are joined, so the cost stays fixed however many are excluded.
+    shown_brands = excluded_brands[:_EXCLUDED_BRANDS_PREVIEW_LIMIT]
+    extra_count = len(excluded_brands) - len(shown_brands)
+    suffix = f" (+{extra_count} till)" if extra_count > 0 else ""
+    return f"Exkluderade varumärken: {', '.join(shown_brands)}{suffix}."
+
+
+# Results render as fragments so pressing a download button reruns only this block
+# instead of the whole app.
+@st.fragment
 def _render_product_compare_results(result: CompareUiResult) -> None:
     if result.warning_message:
         st.warning(result.warning_message)
 
-    only_in_magento_display_df = result.only_in_magento_df.drop(
-        columns=["map_key", "price", "supplier"],
-        errors="ignore",
-    )
-    only_in_hicore_web_visible_in_stock_display_df = (
-        result.only_in_hicore_web_visible_in_stock_df.drop(
-            columns=["map_key", "price", "supplier"],
-            errors="ignore",
-        )
-    )
-    stock_mismatch_display_df = result.stock_mismatch_df.drop(
-        columns=["normalized_sku", "side"],
-        errors="ignore",
-    )
-
     col1, col2, col3 = st.columns(3)
     col1.metric("Unika i Magento", result.only_in_magento_count)
     col2.metric("Endast i HiCore på webb", result.only_in_hicore_web_visible_in_stock_count)
@@ -68,23 +95,44 @@ def _render_product_compare_results(result: CompareUiResult) -> None:
         key="download_stock_mismatch_csv",
     )
 
-    tab1, tab2, tab3 = st.tabs(
-        ["Unika i Magento", "Endast i HiCore på webb", "Lagerdiff"]
+    # Only the selected table is built and sent to the browser; st.tabs would serialize
+    # all three on every run. Switching reruns just this fragment.
+    selected_table = st.radio(
+        "Resultatvy",
+        options=["Unika i Magento", "Endast i HiCore på webb", "Lagerdiff"],
+        key="compare_results_view",
+        horizontal=True,
+        label_visibility="collapsed",
     )
-    with tab1:
+    if selected_table == "Unika i Magento":
+        only_in_magento_display_df = result.only_in_magento_df.drop(
+            columns=["map_key", "price", "supplier"],
+            errors="ignore",
+        )
         st.dataframe(_with_one_based_index(only_in_magento_display_df), use_container_width=True)
-    with tab2:
+    elif selected_table == "Endast i HiCore på webb":
+        only_in_hicore_web_visible_in_stock_display_df = (
+            result.only_in_hicore_web_visible_in_stock_df.drop(
+                columns=["map_key", "price", "supplier"],
+                errors="ignore",
+            )
+        )
         st.dataframe(
             _with_one_based_index(only_in_hicore_web_visible_in_stock_display_df),
             use_container_width=True,
         )
-    with tab3:
+    else:
+        stock_mismatch_display_df = result.stock_mismatch_df.drop(
+            columns=["normalized_sku", "side"],
+            errors="ignore",
+        )
         st.dataframe(
             _style_stock_mismatch_df(_with_one_based_index(stock_mismatch_display_df)),
             use_container_width=True,
         )
 
 
+@st.fragment
 def _render_web_order_compare_results(result: WebOrderCompareUiResult) -> None:
     if result.warning_message:
         st.warning(result.warning_message)
@@ -130,12 +178,7 @@ def _render_compare_page(*, excluded_brands: list[str]) -> None:
         )
 
         if excluded_brands:
-            shown_brands = excluded_brands[:8]
-            extra_count = len(excluded_brands) - len(shown_brands)
-            suffix = f" (+{extra_count} till)" if extra_count > 0 else ""
-            st.info(
-                f"Exkluderade varumärken: {', '.join(shown_brands)}{suffix}."
-            )
+            st.info(_excluded_brands_preview(excluded_brands))
         else:
             st.caption("Inga varumärken exkluderas. Ändra i Inställningar vid behov.")
 
@@ -151,12 +194,16 @@ def _render_compare_page(*, excluded_brands: list[str]) -> None:
             )
             update_progress(0.0, "Startar")
             try:
-                result = _compute_compare_result(
-                    hicore_file_name=str(hicore_file["name"]),  # type: ignore[index]
-                    hicore_bytes=hicore_file["bytes"],  # type: ignore[index]
-                    magento_bytes=magento_file["bytes"],  # type: ignore[index]
-                    excluded_brands=[str(name) for name in excluded_brands],
-                    progress_callback=update_progress,
+                hicore_bytes = hicore_file["bytes"]  # type: ignore[index]
+                magento_bytes = magento_file["bytes"]  # type: ignore[index]
+                result = _cached_compare_result(
+                    str(hicore_file["name"]),  # type: ignore[index]
+                    _stored_file_digest(hicore_file),  # type: ignore[arg-type]
+                    _stored_file_digest(magento_file),  # type: ignore[arg-type]
+                    tuple(excluded_brands),
+                    hicore_bytes,
+                    magento_bytes,
+                    _progress_callback=update_progress,
                 )
                 update_progress(1.0, "Klar")
                 st.session_state["compare_ui_result"] = result
@@ -167,10 +214,12 @@ def _render_compare_page(*, excluded_brands: list[str]) -> None:
             finally:
                 clear_progress()
 
-        if st.session_state["compare_ui_error"]:
-            st.error(st.session_state["compare_ui_error"])
-        if st.session_state["compare_ui_result"] is not None:
-            _render_product_compare_results(st.session_state["compare_ui_result"])
+        compare_error = st.session_state["compare_ui_error"]
+        if compare_error:
+            st.error(compare_error)
+        compare_result = st.session_state["compare_ui_result"]
+        if compare_result is not None:
+            _render_product_compare_results(compare_result)
         return
 
     st.caption("Ladda upp webborderfiler.")
@@ -214,7 +263,9 @@ def _render_compare_page(*, excluded_brands: list[str]) -> None:
         finally:
             clear_progress()
 
-    if st.session_state["web_order_compare_ui_error"]:
-        st.error(st.session_state["web_order_compare_ui_error"])
-    if st.session_state["web_order_compare_ui_result"] is not None:
-        _render_web_order_compare_results(st.session_state["web_order_compare_ui_result"])
+    web_order_error = st.session_state["web_order_compare_ui_error"]
+    if web_order_error:
+        st.error(web_order_error)
+    web_order_result = st.session_state["web_order_compare_ui_result"]
+    if web_order_result is not None:
+        _render_web_order_compare_results(web_order_result)
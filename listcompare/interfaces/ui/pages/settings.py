@@ -11,7 +11,6 @@ from ..runtime_paths import (
     supplier_transform_profiles_path as _supplier_transform_profiles_path,
     ui_settings_path as _ui_settings_path,
 )
-from ..session.file_inputs import get_stored_file as _get_stored_file
 from ..session.run_state import clear_all_run_state as _clear_all_run_state
 from ..session.shared_sync_status import store_shared_sync_status as _store_shared_sync_status
 from ..session.settings_state import (
@@ -128,6 +127,7 @@ def _render_settings_page(
     brand_options: list[str],
     brand_index_error: Optional[str],
     new_brand_names: list[str],
+    current_hicore: Optional[dict[str, object]],
     hicore_missing_brand_column: bool,
 ) -> None:
     st.header(MENU_SETTINGS)
@@ -135,21 +135,22 @@ def _render_settings_page(
     ui_settings_path = _ui_settings_path()
     _render_shared_sync_settings()
 
-    current_hicore = _get_stored_file(st.session_state, kind="hicore")
-    existing_excluded = [name for name in st.session_state["excluded_brands"] if name in brand_options]
-    if existing_excluded != st.session_state["excluded_brands"]:
-        st.session_state["excluded_brands"] = existing_excluded
-        _persist_excluded_brands_setting(st.session_state, path=ui_settings_path)
-        _clear_all_run_state(st.session_state)
-
-    if "excluded_brands_widget" not in st.session_state:
-        st.session_state["excluded_brands_widget"] = list(st.session_state["excluded_brands"])
+    brand_option_set = set(brand_options)
+    session_state = st.session_state
+    stored_excluded = session_state["excluded_brands"]
+    existing_excluded = [name for name in stored_excluded if name in brand_option_set]
+    if existing_excluded != stored_excluded:
+        session_state["excluded_brands"] = existing_excluded
+        _persist_excluded_brands_setting(session_state, path=ui_settings_path)
+        _clear_all_run_state(session_state)
+
+    widget_value = session_state.get("excluded_brands_widget")
+    if widget_value is None:
+        session_state["excluded_brands_widget"] = list(existing_excluded)
     else:
-        widget_selection = [
-            name for name in st.session_state.get("excluded_brands_widget", []) if name in brand_options
-        ]
-        if widget_selection != st.session_state.get("excluded_brands_widget", []):
-            st.session_state["excluded_brands_widget"] = widget_selection
+        widget_selection = [name for name in widget_value if name in brand_option_set]
+        if widget_selection != widget_value:
+            session_state["excluded_brands_widget"] = widget_selection
 
     selected_excluded = st.multiselect(
         "Varumärken som ska exkluderas i körningar",
@@ -158,11 +159,15 @@ def _render_settings_page(
         disabled=bool(current_hicore is not None and hicore_missing_brand_column),
         key="excluded_brands_widget",
     )
-    normalized_selected = [name for name in selected_excluded if name in brand_options]
-    if normalized_selected != st.session_state["excluded_brands"]:
-        st.session_state["excluded_brands"] = normalized_selected
-        _persist_excluded_brands_setting(st.session_state, path=ui_settings_path)
-        _clear_all_run_state(st.session_state)
+    normalized_selected = [name for name in selected_excluded if name in brand_option_set]
+    # Exclusions act as a set, so a reordered selection needs no save or run reset.
+    if normalized_selected != existing_excluded and (
+        len(normalized_selected) != len(existing_excluded)
+        or frozenset(normalized_selected) != frozenset(existing_excluded)
+    ):
+        session_state["excluded_brands"] = normalized_selected
+        _persist_excluded_brands_setting(session_state, path=ui_settings_path)
+        _clear_all_run_state(session_state)
 
     st.caption(f"Antal varumärken: {len(brand_options)}")
     if new_brand_names:
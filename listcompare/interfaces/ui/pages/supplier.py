@@ -96,6 +96,16 @@ def _render_supplier_page(
 
     attention_required = bool(st.session_state.get("supplier_transform_attention_required", False))
     if attention_required:
+        st.warning("Saknad eller ofullständig profil. Gå till Leverantörsprofiler.")
+
+    selected_view = st.radio(
+        "Leverantörsflik",
+        options=list(valid_views),
+        key="supplier_page_view",
+        horizontal=True,
+    )
+    if attention_required and selected_view == SUPPLIER_PAGE_VIEW_COMPARE:
+        # Blinks the Leverantörsprofiler option, so it is only needed while it is not selected.
         st.markdown(
             """
 <style>
@@ -112,14 +122,6 @@ section.main div[data-testid="stRadio"] div[role="radiogroup"][aria-orientation=
             """,
             unsafe_allow_html=True,
         )
-        st.warning("Saknad eller ofullständig profil. Gå till Leverantörsprofiler.")
-
-    selected_view = st.radio(
-        "Leverantörsflik",
-        options=list(valid_views),
-        key="supplier_page_view",
-        horizontal=True,
-    )
     supplier_options, supplier_index_error, sync_warning_message = _sync_supplier_profiles_on_view_entry(
         st.session_state,
         selected_view=selected_view,
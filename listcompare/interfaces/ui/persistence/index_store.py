@@ -1,20 +1,31 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
+from .text_files import write_text_if_changed
 
-def normalize_names(raw_names: list[str]) -> list[str]:
-    unique_by_folded: dict[str, str] = {}
+
+def unique_names_by_folded(raw_names: Iterable[object], unique_by_folded: dict[str, str]) -> None:
     for raw_name in raw_names:
         normalized_name = str(raw_name).strip()
-        if normalized_name == "" or normalized_name.casefold() == "nan":
+        if normalized_name == "":
             continue
         folded_name = normalized_name.casefold()
-        if folded_name not in unique_by_folded:
-            unique_by_folded[folded_name] = normalized_name
+        if folded_name == "nan" or folded_name in unique_by_folded:
+            continue
+        unique_by_folded[folded_name] = normalized_name
+
 
-    return sorted(unique_by_folded.values(), key=lambda name: name.casefold())
+def sorted_by_folded(unique_by_folded: dict[str, str]) -> list[str]:
+    # Keys are already the casefolded names, so sorting them avoids folding every name again.
+    return [unique_by_folded[folded_name] for folded_name in sorted(unique_by_folded)]
+
+
+def normalize_names(raw_names: Iterable[object]) -> list[str]:
+    unique_by_folded: dict[str, str] = {}
+    unique_names_by_folded(raw_names, unique_by_folded)
+    return sorted_by_folded(unique_by_folded)
 
 
 def _load_name_index(path: Path, *, missing_label: str) -> tuple[list[str], Optional[str]]:
@@ -34,7 +45,7 @@ def _save_name_index(path: Path, names: list[str]) -> None:
     body = "\n".join(normalized_names)
     if body != "":
         body += "\n"
-    path.write_text(body, encoding="utf-8-sig")
+    write_text_if_changed(path, body, encoding="utf-8-sig")
 
 
 def load_suppliers_from_index(path: Path) -> tuple[list[str], Optional[str]]:
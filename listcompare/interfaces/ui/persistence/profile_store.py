@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 
+import copy
 import json
 from pathlib import Path
 from typing import Optional
@@ -8,15 +9,35 @@ from ....core.suppliers.profile import (
     build_profiles_payload as _build_profiles_payload,
     parse_profiles_payload as _parse_profiles_payload,
 )
+from .text_files import file_signature, json_file_text, write_text_if_changed
+
+# Parsed profiles per file path, reused while the file's mtime and size are
+# unchanged. Callers get deep copies so cached entries are never mutated.
+_PROFILES_CACHE: dict[object, tuple[tuple[int, int], dict[str, dict[str, object]]]] = {}
+
+
+def clear_profiles_cache() -> None:
+    _PROFILES_CACHE.clear()
 
 
 def load_profiles(path: Path) -> tuple[dict[str, dict[str, object]], Optional[str]]:
-    if not path.exists():
+    # One stat both proves the file exists and keys the cache, so a cache hit costs a
+    # single syscall; only paths that cannot be stat-ed fall back to exists().
+    signature = file_signature(path)
+    if signature is None and not path.exists():
         return {}, None
 
     try:
+        cached = _PROFILES_CACHE.get(path)
+        if signature is not None and cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1]), None
+
         raw = json.loads(path.read_text(encoding="utf-8-sig"))
-        return _parse_profiles_payload(raw), None
+        profiles = _parse_profiles_payload(raw)
+        if signature is not None:
+            _PROFILES_CACHE[path] = (signature, profiles)
+            return copy.deepcopy(profiles), None
+        return profiles, None
     except Exception as exc:
         return {}, str(exc)
 
@@ -25,10 +46,23 @@ def save_profiles(
     path: Path,
     *,
     profiles: dict[str, dict[str, object]],
+    already_normalized: bool = False,
 ) -> Optional[str]:
-    payload = _build_profiles_payload(profiles)
+    # Callers holding profiles from load_profiles can skip re-normalizing every entry.
+    payload = {"profiles": profiles} if already_normalized else _build_profiles_payload(profiles)
+    _PROFILES_CACHE.pop(path, None)
     try:
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-        return None
+        write_text_if_changed(
+            path,
+            json_file_text(payload),
+            encoding="utf-8",
+        )
     except Exception as exc:
         return str(exc)
+
+    # The written profiles are exactly what the next load would parse back, so seed the
+    # cache and spare the reload after a save.
+    signature = file_signature(path)
+    if signature is not None:
+        _PROFILES_CACHE[path] = (signature, copy.deepcopy(payload["profiles"]))
+    return None
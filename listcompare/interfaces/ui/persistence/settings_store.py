@@ -5,14 +5,24 @@ from pathlib import Path
 from typing import Optional
 
 from .index_store import normalize_names
+from .text_files import file_signature, json_file_text, write_text_if_changed
+
+# Parsed excluded brands per settings path, reused while the file's mtime and size are
+# unchanged so new sessions skip the JSON parse.
+_SETTINGS_CACHE: dict[object, tuple[tuple[int, int], tuple[str, ...]]] = {}
 
 
 def load_ui_settings(path: Path) -> tuple[dict[str, list[str]], Optional[str]]:
     default_settings: dict[str, list[str]] = {"excluded_brands": []}
-    if not path.exists():
+    signature = file_signature(path)
+    if signature is None and not path.exists():
         return default_settings, None
 
     try:
+        cached = _SETTINGS_CACHE.get(path)
+        if signature is not None and cached is not None and cached[0] == signature:
+            return {"excluded_brands": list(cached[1])}, None
+
         raw = json.loads(path.read_text(encoding="utf-8-sig"))
         if not isinstance(raw, dict):
             raise ValueError("ui_settings.json måste innehålla ett JSON-objekt.")
@@ -22,6 +32,8 @@ def load_ui_settings(path: Path) -> tuple[dict[str, list[str]], Optional[str]]:
             raise ValueError('Fältet "excluded_brands" måste vara en lista.')
 
         excluded_brands = normalize_names([str(name) for name in raw_excluded])
+        if signature is not None:
+            _SETTINGS_CACHE[path] = (signature, tuple(excluded_brands))
         return {"excluded_brands": excluded_brands}, None
     except Exception as exc:
         return default_settings, str(exc)
@@ -29,9 +41,11 @@ def load_ui_settings(path: Path) -> tuple[dict[str, list[str]], Optional[str]]:
 
 def save_ui_settings(path: Path, *, excluded_brands: list[str]) -> Optional[str]:
     payload = {"excluded_brands": normalize_names([str(name) for name in excluded_brands])}
+    _SETTINGS_CACHE.pop(path, None)
     try:
-        path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
+        write_text_if_changed(
+            path,
+            json_file_text(payload),
             encoding="utf-8",
         )
         return None
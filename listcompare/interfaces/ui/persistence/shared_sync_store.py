@@ -4,6 +4,8 @@ import json
 from pathlib import Path
 from typing import Optional
 
+from .text_files import json_file_text, write_text_if_changed
+
 
 def load_shared_sync_config(path: Path) -> tuple[dict[str, str], Optional[str]]:
     default_config = {"shared_folder": ""}
@@ -28,8 +30,9 @@ def save_shared_sync_config(path: Path, *, shared_folder: str) -> Optional[str]:
         parent = getattr(path, "parent", None)
         if parent is not None and hasattr(parent, "mkdir"):
             parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
+        write_text_if_changed(
+            path,
+            json_file_text(payload),
             encoding="utf-8",
         )
         return None
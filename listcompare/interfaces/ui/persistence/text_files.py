@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+# json.dumps builds a fresh encoder whenever options are passed; the stores share one.
+_JSON_FILE_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def json_file_text(payload: object) -> str:
+    return _JSON_FILE_ENCODER.encode(payload) + "\n"
+
+
+def file_signature(path: Path) -> Optional[tuple[int, int]]:
+    """Return ``(mtime_ns, size)`` for cache keys, or ``None`` when it cannot be read."""
+
+    stat = getattr(path, "stat", None)
+    if stat is None:
+        return None
+    try:
+        stat_result = stat()
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _read_existing_text(path: Path, *, encoding: str) -> str | None:
+    try:
+        if not path.exists():
+            return None
+        return path.read_text(encoding=encoding)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def write_text_if_changed(path: Path, text: str, *, encoding: str) -> bool:
+    """Write ``text`` unless the file already holds it; returns whether it wrote."""
+
+    if _read_existing_text(path, encoding=encoding) == text:
+        return False
+    if not isinstance(path, Path):
+        path.write_text(text, encoding=encoding)
+        return True
+
+    # Write a per-writer sibling temp file and swap it in, so a crash never leaves a
+    # truncated file and two sessions saving at once cannot interleave their writes.
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with temp_path.open("w", encoding=encoding) as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
@@ -24,12 +24,15 @@ def compute_compare_result(
     magento_bytes: bytes,
     *,
     excluded_brands: Optional[list[str]] = None,
+    hicore_digest: Optional[str] = None,
     progress_callback: Optional[ProgressCallback] = None,
 ) -> CompareUiResult:
     """Compute the main HiCore-Magento compare previews and CSV exports."""
 
     _notify_progress(progress_callback, 0.05, "Läser HiCore-fil")
-    df_hicore = load_hicore_compare_df(hicore_file_name, hicore_bytes)
+    df_hicore = load_hicore_compare_df(
+        hicore_file_name, hicore_bytes, hicore_digest=hicore_digest
+    )
     _notify_progress(progress_callback, 0.20, "Läser Magento-fil")
     df_magento = load_magento_compare_df(magento_bytes)
     _notify_progress(progress_callback, 0.40, "Bygger compare-underlag")
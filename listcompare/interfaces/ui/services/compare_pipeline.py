@@ -23,6 +23,7 @@ from ....core.products.product_mapping import prepare_data
 from ....core.products.product_normalization import (
     compute_hicore_stock_with_fallback,
     normalise_price,
+    normalize_sku_values,
     to_str,
 )
 from ....core.products.product_schema import HICORE_COLUMNS
@@ -40,8 +41,13 @@ class CompareComputationArtifacts:
     warning_message: Optional[str]
 
 
-def load_hicore_compare_df(hicore_file_name: str, hicore_bytes: bytes) -> pd.DataFrame:
-    return _read_hicore_upload(hicore_file_name, hicore_bytes)
+def load_hicore_compare_df(
+    hicore_file_name: str,
+    hicore_bytes: bytes,
+    *,
+    hicore_digest: Optional[str] = None,
+) -> pd.DataFrame:
+    return _read_hicore_upload(hicore_file_name, hicore_bytes, data_digest=hicore_digest)
 
 
 def load_magento_compare_df(magento_bytes: bytes) -> pd.DataFrame:
@@ -152,7 +158,7 @@ def _only_in_hicore_web_visible_in_stock_df(
         return _empty_only_in_hicore_web_visible_df(), None
 
     df = pd.DataFrame(rows)
-    df["_lc_sort_sku"] = df["sku"].map(lambda value: normalize_sku(str(value).strip()))
+    df["_lc_sort_sku"] = normalize_sku_values(df["sku"])
     df["_lc_sort_sku_raw"] = df["sku"].map(lambda value: str(value).strip())
     df = df.sort_values(by=["_lc_sort_sku", "_lc_sort_sku_raw"], kind="stable")
     df = df.drop(columns=["_lc_sort_sku", "_lc_sort_sku_raw"])
@@ -165,16 +171,17 @@ def build_compare_artifacts(
     *,
     excluded_brands: Optional[list[str]] = None,
 ) -> CompareComputationArtifacts:
-    hicore_map, magento_map = prepare_data(df_hicore, df_magento)
     excluded_normalized_skus, warning_message = _normalized_skus_for_excluded_brands(
         df_hicore,
         excluded_brands or [],
     )
-    comparison_results = build_comparison_results(
-        hicore_map,
-        magento_map,
+    # Excluded SKUs are dropped while the maps are built, so the comparison needs no second filter.
+    hicore_map, magento_map = prepare_data(
+        df_hicore,
+        df_magento,
         excluded_normalized_skus=excluded_normalized_skus,
     )
+    comparison_results = build_comparison_results(hicore_map, magento_map)
     only_in_magento_skus = unique_sorted_skus_from_product_map(comparison_results.only_in_magento)
     only_in_hicore_normalized_skus = {
         normalize_sku(str(sku))
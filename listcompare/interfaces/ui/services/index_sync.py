@@ -78,6 +78,7 @@ def sync_index_options_from_uploaded_hicore(
         ) = _load_names_from_uploaded_hicore(
             str(stored_hicore_file["name"]),
             stored_hicore_file["bytes"],  # type: ignore[index]
+            uploaded_digest=stored_hicore_file.get("digest"),  # type: ignore[arg-type]
         )
         supplier_options, new_supplier_names = _merge_supplier_lists(
             supplier_options,
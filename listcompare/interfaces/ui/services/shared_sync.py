@@ -7,7 +7,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional
 
-from ....core.suppliers.profile import normalized_profiles_dict as _normalized_profiles_dict
 from ..io.index_names import _merge_supplier_lists
 from ..persistence import index_store as _index_store
 from ..persistence import profile_store as _profile_store
@@ -265,12 +264,14 @@ def _load_profiles(path: Path) -> dict[str, dict[str, object]]:
     values, error = _profile_store.load_profiles(path)
     if error:
         raise ValueError(error)
-    return _normalized_profiles_dict(values)
+    # load_profiles already returns normalized profiles.
+    return values
 
 
 def _save_profiles(path: Path, values: dict[str, dict[str, object]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    error = _profile_store.save_profiles(path, profiles=values)
+    # Merged profiles come straight from load_profiles, so they are already normalized.
+    error = _profile_store.save_profiles(path, profiles=values, already_normalized=True)
     if error:
         raise ValueError(error)
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import AbstractSet, Optional
 
 import pandas as pd
 
 from ....core.comparison import unique_sorted_skus_from_product_map
 from ....core.products.product_diff import normalize_sku
+from ....core.products.product_normalization import normalize_sku_values
 from ....core.products.product_schema import HICORE_COLUMNS
 from ....core.suppliers.supplier_selection import filter_rows_by_normalized_skus
 from ..common import SupplierUiResult
@@ -24,7 +25,11 @@ from ..io.tables import (
     _mismatch_map_to_df,
     _product_map_to_df,
 )
-from .supplier_pipeline import build_supplier_artifacts, load_hicore_compare_df
+from .supplier_pipeline import (
+    build_supplier_artifacts,
+    load_hicore_compare_df,
+    load_hicore_product_map,
+)
 
 
 def _build_supplier_price_export_df(
@@ -59,7 +64,7 @@ def _build_supplier_price_export_df(
         return pd.DataFrame(columns=export_columns)
 
     cleaned_skus = filtered_rows[id_column].map(_to_clean_text)
-    normalized_row_skus = cleaned_skus.map(lambda value: normalize_sku(str(value)))
+    normalized_row_skus = normalize_sku_values(cleaned_skus)
     export_df = pd.DataFrame()
     export_df[sku_column_name] = [
         hicore_skus_by_normalized_sku.get(normalized_sku, raw_sku)
@@ -110,13 +115,16 @@ def compute_supplier_result(
     supplier_name: str,
     supplier_df: pd.DataFrame,
     excluded_brands: Optional[list[str]] = None,
-    profile_excluded_normalized_skus: Optional[set[str]] = None,
+    profile_excluded_normalized_skus: Optional[AbstractSet[str]] = None,
+    hicore_digest: Optional[str] = None,
     progress_callback: Optional[ProgressCallback] = None,
 ) -> SupplierUiResult:
     """Compute supplier compare previews and export payloads for the UI."""
 
     _notify_progress(progress_callback, 0.05, "Läser HiCore-fil")
-    df_hicore = load_hicore_compare_df(hicore_file_name, hicore_bytes)
+    df_hicore = load_hicore_compare_df(
+        hicore_file_name, hicore_bytes, hicore_digest=hicore_digest
+    )
     _notify_progress(progress_callback, 0.40, "Bygger compare-underlag")
     _notify_progress(progress_callback, 0.62, "Jämför mot HiCore")
     artifacts = build_supplier_artifacts(
@@ -125,6 +133,9 @@ def compute_supplier_result(
         supplier_df=supplier_df,
         excluded_brands=excluded_brands,
         profile_excluded_normalized_skus=profile_excluded_normalized_skus,
+        hicore_map=load_hicore_product_map(
+            hicore_file_name, hicore_bytes, hicore_digest=hicore_digest
+        ),
     )
     results = artifacts.comparison_results
 
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import AbstractSet, Optional
 
 import pandas as pd
 
 from ....core.comparison import SupplierComparisonResults, build_supplier_comparison_results
+from ....core.products.product_diff import ProductMap
 from ....core.products.product_mapping import build_product_map
 from ....core.products.product_schema import HICORE_COLUMNS, Product
 from ....core.suppliers.supplier_products import (
@@ -18,7 +19,7 @@ from ....core.suppliers.supplier_products import (
 from ....core.suppliers.supplier_selection import normalized_skus_from_product_map
 from ..compute_shared import _find_case_insensitive_column, _hicore_purchase_column_name
 from ..io.brand_filter import _normalized_skus_for_excluded_brands
-from ..io.uploads import _read_hicore_upload
+from ..io.uploads import _read_hicore_product_map, _read_hicore_upload
 
 
 @dataclass(frozen=True)
@@ -37,8 +38,22 @@ class SupplierComputationArtifacts:
     warning_message: Optional[str]
 
 
-def load_hicore_compare_df(hicore_file_name: str, hicore_bytes: bytes) -> pd.DataFrame:
-    return _read_hicore_upload(hicore_file_name, hicore_bytes)
+def load_hicore_compare_df(
+    hicore_file_name: str,
+    hicore_bytes: bytes,
+    *,
+    hicore_digest: Optional[str] = None,
+) -> pd.DataFrame:
+    return _read_hicore_upload(hicore_file_name, hicore_bytes, data_digest=hicore_digest)
+
+
+def load_hicore_product_map(
+    hicore_file_name: str,
+    hicore_bytes: bytes,
+    *,
+    hicore_digest: Optional[str] = None,
+) -> ProductMap:
+    return _read_hicore_product_map(hicore_file_name, hicore_bytes, data_digest=hicore_digest)
 
 
 def _hicore_skus_by_normalized_sku(
@@ -60,23 +75,27 @@ def build_supplier_artifacts(
     supplier_name: str,
     supplier_df: pd.DataFrame,
     excluded_brands: Optional[list[str]] = None,
-    profile_excluded_normalized_skus: Optional[set[str]] = None,
+    profile_excluded_normalized_skus: Optional[AbstractSet[str]] = None,
+    hicore_map: Optional[ProductMap] = None,
 ) -> SupplierComputationArtifacts:
-    hicore_map = build_product_map(
-        df_hicore,
-        source="hicore",
-        columns=HICORE_COLUMNS,
-    )
+    if hicore_map is None:
+        hicore_map = build_product_map(
+            df_hicore,
+            source="hicore",
+            columns=HICORE_COLUMNS,
+        )
     excluded_normalized_skus, warning_message = _normalized_skus_for_excluded_brands(
         df_hicore,
         excluded_brands or [],
     )
-    combined_excluded_normalized_skus = {
-        sku
-        for sku in (profile_excluded_normalized_skus or set())
-        if str(sku).strip() != ""
-    }
-    combined_excluded_normalized_skus.update(excluded_normalized_skus)
+    # Both sides are already normalized; reuse whichever set is non-empty instead of copying.
+    combined_excluded_normalized_skus: AbstractSet[str] = excluded_normalized_skus
+    if profile_excluded_normalized_skus:
+        profile_skus = {
+            sku for sku in profile_excluded_normalized_skus if str(sku).strip() != ""
+        }
+        profile_skus.update(excluded_normalized_skus)
+        combined_excluded_normalized_skus = profile_skus
 
     prepared_supplier_df = supplier_df.copy()
     supplier_source_columns = list(prepared_supplier_df.columns)
@@ -124,7 +143,7 @@ def build_supplier_artifacts_from_uploads(
     supplier_name: str,
     supplier_df: pd.DataFrame,
     excluded_brands: Optional[list[str]] = None,
-    profile_excluded_normalized_skus: Optional[set[str]] = None,
+    profile_excluded_normalized_skus: Optional[AbstractSet[str]] = None,
 ) -> SupplierComputationArtifacts:
     df_hicore = load_hicore_compare_df(hicore_file_name, hicore_bytes)
     return build_supplier_artifacts(
@@ -133,4 +152,5 @@ def build_supplier_artifacts_from_uploads(
         supplier_df=supplier_df,
         excluded_brands=excluded_brands,
         profile_excluded_normalized_skus=profile_excluded_normalized_skus,
+        hicore_map=load_hicore_product_map(hicore_file_name, hicore_bytes),
     )
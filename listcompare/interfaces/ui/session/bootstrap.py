@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from ..common import (
     COMPARE_PAGE_MODE_PRODUCTS,
     FILE_STATE_KEYS,
@@ -16,7 +18,65 @@ from ..runtime_paths import (
 from .settings_state import load_ui_settings
 
 
-def init_session_state(session_state: dict[str, object]) -> None:
+# Defaults that do not depend on files on disk. They are built once at import; the
+# mutable ones get a fresh instance from their factory per session.
+_STATIC_DEFAULTS: dict[str, object] = {
+    FILE_STATE_KEYS["hicore"]: None,
+    FILE_STATE_KEYS["magento"]: None,
+    FILE_STATE_KEYS["compare_web_orders_hicore"]: None,
+    FILE_STATE_KEYS["compare_web_orders_magento"]: None,
+    FILE_STATE_KEYS["supplier"]: None,
+    "compare_ui_result": None,
+    "compare_ui_error": None,
+    "web_order_compare_ui_result": None,
+    "web_order_compare_ui_error": None,
+    "compare_page_mode": COMPARE_PAGE_MODE_PRODUCTS,
+    "supplier_ui_result": None,
+    "supplier_ui_error": None,
+    "supplier_prepared_df": None,
+    "supplier_prepared_signature": None,
+    "supplier_prepared_excluded_normalized_skus": frozenset(),
+    "supplier_prepared_file_name": None,
+    "supplier_prepared_excel_bytes": None,
+    "supplier_ignored_rows_df": None,
+    "supplier_ignored_rows_file_name": None,
+    "supplier_ignored_rows_excel_bytes": None,
+    "supplier_prepare_analysis": None,
+    "supplier_internal_name": None,
+    "_last_supplier_internal_name": None,
+    "ui_settings_save_error": None,
+    "shared_sync_save_error": None,
+    "shared_sync_status_level": "disabled",
+    "shared_sync_status_message": None,
+    "shared_sync_profile_conflicts": (),
+    "shared_sync_status_source": None,
+    "supplier_transform_profiles_save_error": None,
+    "supplier_page_view": SUPPLIER_PAGE_VIEW_COMPARE,
+    "supplier_page_view_last_rendered": SUPPLIER_PAGE_VIEW_COMPARE,
+    "supplier_page_view_request": None,
+    "supplier_profiles_mode": SUPPLIER_PROFILE_MODE_OVERVIEW,
+    "supplier_profiles_mode_request": None,
+    "supplier_profiles_supplier_request": None,
+    "supplier_profiles_search_query": "",
+    "supplier_profiles_delete_confirm": False,
+    "supplier_transform_attention_required": False,
+    "supplier_compare_info_message": None,
+}
+_MUTABLE_DEFAULT_FACTORIES: dict[str, Callable[[], object]] = {
+    "supplier_prepare_resolution_choices": dict,
+    "_auto_shared_sync_cache": dict,
+}
+_PERSISTED_DEFAULT_KEYS = (
+    "excluded_brands",
+    "ui_settings_load_error",
+    "shared_sync_folder",
+    "shared_sync_load_error",
+    "supplier_transform_profiles",
+    "supplier_transform_profiles_load_error",
+)
+
+
+def _persisted_defaults() -> dict[str, object]:
     ui_settings, ui_settings_error = load_ui_settings(_ui_settings_path())
     shared_sync_config, shared_sync_config_error = _shared_sync_store.load_shared_sync_config(
         _shared_sync_config_path()
@@ -24,57 +84,26 @@ def init_session_state(session_state: dict[str, object]) -> None:
     supplier_transform_profiles, supplier_transform_profiles_error = _profile_store.load_profiles(
         _supplier_transform_profiles_path()
     )
-
-    defaults: dict[str, object] = {
-        FILE_STATE_KEYS["hicore"]: None,
-        FILE_STATE_KEYS["magento"]: None,
-        FILE_STATE_KEYS["compare_web_orders_hicore"]: None,
-        FILE_STATE_KEYS["compare_web_orders_magento"]: None,
-        FILE_STATE_KEYS["supplier"]: None,
-        "compare_ui_result": None,
-        "compare_ui_error": None,
-        "web_order_compare_ui_result": None,
-        "web_order_compare_ui_error": None,
-        "compare_page_mode": COMPARE_PAGE_MODE_PRODUCTS,
-        "supplier_ui_result": None,
-        "supplier_ui_error": None,
-        "supplier_prepared_df": None,
-        "supplier_prepared_signature": None,
-        "supplier_prepared_excluded_normalized_skus": frozenset(),
-        "supplier_prepared_file_name": None,
-        "supplier_prepared_excel_bytes": None,
-        "supplier_ignored_rows_df": None,
-        "supplier_ignored_rows_file_name": None,
-        "supplier_ignored_rows_excel_bytes": None,
-        "supplier_prepare_analysis": None,
-        "supplier_prepare_resolution_choices": {},
+    return {
         "excluded_brands": list(ui_settings.get("excluded_brands", [])),
-        "supplier_internal_name": None,
-        "_last_supplier_internal_name": None,
         "ui_settings_load_error": ui_settings_error,
-        "ui_settings_save_error": None,
         "shared_sync_folder": str(shared_sync_config.get("shared_folder", "")).strip(),
         "shared_sync_load_error": shared_sync_config_error,
-        "shared_sync_save_error": None,
-        "shared_sync_status_level": "disabled",
-        "shared_sync_status_message": None,
-        "shared_sync_profile_conflicts": (),
-        "shared_sync_status_source": None,
-        "_auto_shared_sync_cache": {},
         "supplier_transform_profiles": dict(supplier_transform_profiles),
         "supplier_transform_profiles_load_error": supplier_transform_profiles_error,
-        "supplier_transform_profiles_save_error": None,
-        "supplier_page_view": SUPPLIER_PAGE_VIEW_COMPARE,
-        "supplier_page_view_last_rendered": SUPPLIER_PAGE_VIEW_COMPARE,
-        "supplier_page_view_request": None,
-        "supplier_profiles_mode": SUPPLIER_PROFILE_MODE_OVERVIEW,
-        "supplier_profiles_mode_request": None,
-        "supplier_profiles_supplier_request": None,
-        "supplier_profiles_search_query": "",
-        "supplier_profiles_delete_confirm": False,
-        "supplier_transform_attention_required": False,
-        "supplier_compare_info_message": None,
     }
-    for key, value in defaults.items():
+
+
+def init_session_state(session_state: dict[str, object]) -> None:
+    for key, value in _STATIC_DEFAULTS.items():
+        if key not in session_state:
+            session_state[key] = value
+    for key, factory in _MUTABLE_DEFAULT_FACTORIES.items():
+        if key not in session_state:
+            session_state[key] = factory()
+    # Settings files are only read while a persisted key is still unset, not on every rerun.
+    if all(key in session_state for key in _PERSISTED_DEFAULT_KEYS):
+        return
+    for key, value in _persisted_defaults().items():
         if key not in session_state:
             session_state[key] = value
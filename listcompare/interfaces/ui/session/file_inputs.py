@@ -6,6 +6,7 @@ from typing import Optional
 import streamlit as st
 
 from ..common import FILE_STATE_KEYS, UPLOADER_KEYS_BY_KIND
+from ..io.uploads import _upload_digest
 from .navigation import rerun as _rerun
 from .run_state import clear_all_run_state as _clear_all_run_state
 
@@ -21,6 +22,16 @@ def get_stored_file(
     return None
 
 
+def stored_file_digest(stored: dict[str, object]) -> str:
+    digest = stored.get("digest")
+    if isinstance(digest, str):
+        return digest
+    # Uploads stored before the digest was kept alongside the bytes get it on first use.
+    digest = _upload_digest(stored["bytes"])  # type: ignore[arg-type]
+    stored["digest"] = digest
+    return digest
+
+
 def store_uploaded_file(
     session_state: dict[str, object],
     *,
@@ -28,9 +39,14 @@ def store_uploaded_file(
     uploaded_file,
     clear_all_run_state: Optional[Callable[[], None]] = None,
 ) -> None:
+    # UploadedFile wraps the uploader's bytes in a BytesIO, and getvalue() on an unmodified
+    # BytesIO hands back that same object, so the session shares the upload, not a copy.
+    # The digest is computed once here and keys the cached readers for this upload.
+    data = uploaded_file.getvalue()
     session_state[FILE_STATE_KEYS[kind]] = {
         "name": uploaded_file.name,
-        "bytes": uploaded_file.getvalue(),
+        "bytes": data,
+        "digest": _upload_digest(data),
     }
     if clear_all_run_state is None:
         _clear_all_run_state(session_state)
@@ -3,7 +3,9 @@ from __future__ import annotations
 from ....core.suppliers.profile import (
     SUPPLIER_TRANSFORM_DEFAULT_FILTERS,
     SUPPLIER_TRANSFORM_DEFAULT_OPTIONS,
+    normalize_supplier_transform_profile_composite_fields as _normalize_supplier_transform_profile_composite_fields,
     normalize_supplier_transform_profile_details as _normalize_supplier_transform_profile_details,
+    normalize_supplier_transform_profile_mapping as _normalize_supplier_transform_profile_mapping,
 )
 
 
@@ -55,14 +57,46 @@ def supplier_has_saved_profile(session_state: dict[str, object], supplier_name:
     return bool(mapping)
 
 
+def _profile_has_mapping(raw_profile: dict[object, object]) -> bool:
+    # Same outcome as the mapping from the full details normalization, without
+    # normalizing filters and options that the check never looks at.
+    raw_mapping = raw_profile.get("target_to_source", raw_profile)
+    if not isinstance(raw_mapping, dict):
+        return False
+    mapping = _normalize_supplier_transform_profile_mapping(raw_mapping)
+    if not mapping:
+        return False
+    raw_composite_fields = raw_profile.get("composite_fields", {})
+    if not isinstance(raw_composite_fields, dict):
+        return True
+    composite_fields = _normalize_supplier_transform_profile_composite_fields(raw_composite_fields)
+    return any(target_column not in composite_fields for target_column in mapping)
+
+
+def suppliers_with_saved_profile(session_state: dict[str, object]) -> set[str]:
+    raw_profiles = session_state.get("supplier_transform_profiles", {})
+    if not isinstance(raw_profiles, dict):
+        return set()
+    names: set[str] = set()
+    for name, raw_profile in raw_profiles.items():
+        if not isinstance(name, str) or not isinstance(raw_profile, dict):
+            continue
+        if _profile_has_mapping(raw_profile):
+            names.add(name)
+    names.discard("")
+    return names
+
+
 def split_suppliers_by_profile(
     session_state: dict[str, object],
     supplier_options: list[str],
 ) -> tuple[list[str], list[str]]:
+    # Normalize each stored profile once instead of once per listed supplier.
+    profile_names = suppliers_with_saved_profile(session_state)
     suppliers_with_profile: list[str] = []
     suppliers_without_profile: list[str] = []
     for supplier_name in supplier_options:
-        if supplier_has_saved_profile(session_state, supplier_name):
+        if str(supplier_name).strip() in profile_names:
             suppliers_with_profile.append(supplier_name)
         else:
             suppliers_without_profile.append(supplier_name)
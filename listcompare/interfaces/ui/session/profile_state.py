@@ -4,7 +4,7 @@ from typing import Optional
 
 from ....core.suppliers.profile import (
     SUPPLIER_TRANSFORM_DEFAULT_FILTERS,
-    normalize_supplier_transform_profile_details as _normalize_supplier_transform_profile_details,
+    normalized_profiles_dict as _normalized_profiles_dict,
     normalize_supplier_transform_profile_filters as _normalize_supplier_transform_profile_filters,
     normalize_supplier_transform_profile_mapping as _normalize_supplier_transform_profile_mapping,
     normalize_supplier_transform_profile_options as _normalize_supplier_transform_profile_options,
@@ -54,29 +54,9 @@ def persist_supplier_transform_profile(
     if load_error:
         return f"Kunde inte läsa profiler innan sparning: {load_error}"
 
-    profiles: dict[str, dict[str, object]] = {}
-    for name, raw_profile in loaded_profiles.items():
-        if not isinstance(name, str) or not isinstance(raw_profile, dict):
-            continue
-        mapping, normalized_composite_fields, normalized_filters, normalized_options = (
-            _normalize_supplier_transform_profile_details(raw_profile)
-        )
-        if not mapping:
-            continue
-        normalized_profile: dict[str, object] = {
-            "target_to_source": _ordered_supplier_transform_profile_mapping(mapping),
-            "options": normalized_options,
-        }
-        if normalized_composite_fields:
-            normalized_profile["composite_fields"] = _ordered_supplier_transform_profile_composite_fields(
-                normalized_composite_fields
-            )
-        normalized_profile_filters = _normalize_supplier_transform_profile_filters(
-            normalized_filters
-        )
-        if normalized_profile_filters != dict(SUPPLIER_TRANSFORM_DEFAULT_FILTERS):
-            normalized_profile["filters"] = normalized_profile_filters
-        profiles[name] = normalized_profile
+    # load_profiles already returns canonical profiles; only the edited entry is normalized below,
+    # the same way save_profiles would, so the merged dict can be written as-is.
+    profiles = dict(loaded_profiles)
 
     profile_payload: dict[str, object] = {
         "target_to_source": _ordered_supplier_transform_profile_mapping(
@@ -94,11 +74,20 @@ def persist_supplier_transform_profile(
     )
     if normalized_filters != dict(SUPPLIER_TRANSFORM_DEFAULT_FILTERS):
         profile_payload["filters"] = normalized_filters
-    profiles[normalized_supplier_name] = profile_payload
+    # Assigned in place so an edited profile keeps its position in the saved file; a
+    # profile that normalizes away (no mapping) is dropped, as save_profiles would.
+    normalized_profile = _normalized_profiles_dict(
+        {normalized_supplier_name: profile_payload}
+    ).get(normalized_supplier_name)
+    if normalized_profile is None:
+        profiles.pop(normalized_supplier_name, None)
+    else:
+        profiles[normalized_supplier_name] = normalized_profile
 
     save_error = _profile_store.save_profiles(
         _supplier_transform_profiles_path(),
         profiles=profiles,
+        already_normalized=True,
     )
     session_state["supplier_transform_profiles_save_error"] = save_error
     if save_error is None:
@@ -143,35 +132,18 @@ def delete_supplier_transform_profile(
     if load_error:
         return f"Kunde inte läsa profiler innan borttagning: {load_error}"
 
-    profiles: dict[str, dict[str, object]] = {}
-    for name, raw_profile in loaded_profiles.items():
-        if not isinstance(name, str) or not isinstance(raw_profile, dict):
-            continue
-        if name.strip().casefold() == normalized_supplier_name.casefold():
-            continue
-        mapping, normalized_composite_fields, normalized_filters, normalized_options = (
-            _normalize_supplier_transform_profile_details(raw_profile)
-        )
-        if not mapping:
-            continue
-        normalized_profile: dict[str, object] = {
-            "target_to_source": _ordered_supplier_transform_profile_mapping(mapping),
-            "options": normalized_options,
-        }
-        if normalized_composite_fields:
-            normalized_profile["composite_fields"] = _ordered_supplier_transform_profile_composite_fields(
-                normalized_composite_fields
-            )
-        normalized_profile_filters = _normalize_supplier_transform_profile_filters(
-            normalized_filters
-        )
-        if normalized_profile_filters != dict(SUPPLIER_TRANSFORM_DEFAULT_FILTERS):
-            normalized_profile["filters"] = normalized_profile_filters
-        profiles[name] = normalized_profile
+    # load_profiles already returns canonical profiles, so only the deleted entry is dropped.
+    deleted_folded = normalized_supplier_name.casefold()
+    profiles = {
+        name: profile
+        for name, profile in loaded_profiles.items()
+        if name.casefold() != deleted_folded
+    }
 
     save_error = _profile_store.save_profiles(
         _supplier_transform_profiles_path(),
         profiles=profiles,
+        already_normalized=True,
     )
     session_state["supplier_transform_profiles_save_error"] = save_error
     if save_error is None:
@@ -1,11 +1,15 @@
 import unittest
 
+import pandas as pd
+
 from listcompare.core.products.product_diff import (
+    build_normalized_map,
     find_field_mismatches_by_sku,
     find_missing_skus,
     normalize_comparable_sku,
     normalize_sku,
 )
+from listcompare.core.products.product_filters import normalized_skus_from_brand_filter
 from listcompare.core.products.product_schema import Product
 
 
@@ -85,6 +89,65 @@ class ProductDiffTests(unittest.TestCase):
 
         self.assertEqual(mismatches, {})
 
+    def test_diff_helpers_accept_prebuilt_normalized_maps(self) -> None:
+        hicore_map = {
+            "0001": [make_product(sku="0001", source="hicore", stock="10")],
+            "0002": [make_product(sku="0002", source="hicore", stock="1")],
+        }
+        magento_map = {
+            "1": [make_product(sku="1", source="magento", stock="8")],
+            "3": [make_product(sku="3", source="magento", stock="1")],
+        }
+        hicore_norm_map = build_normalized_map(hicore_map)
+        magento_norm_map = build_normalized_map(magento_map)
+
+        self.assertEqual(
+            find_missing_skus(
+                hicore_map,
+                magento_map,
+                hicore_norm_map=hicore_norm_map,
+                magento_norm_map=magento_norm_map,
+            ),
+            find_missing_skus(hicore_map, magento_map),
+        )
+        self.assertEqual(
+            find_field_mismatches_by_sku(
+                hicore_map,
+                magento_map,
+                field="stock",
+                hicore_norm_map=hicore_norm_map,
+                magento_norm_map=magento_norm_map,
+            ),
+            find_field_mismatches_by_sku(hicore_map, magento_map, field="stock"),
+        )
+
+    def test_brand_filter_collects_normalized_skus_for_selected_brands(self) -> None:
+        df = pd.DataFrame(
+            {
+                "Brand": [" Acme ", "acme", "Other", None, "nan", "ACME", "Acme"],
+                "Sku": ["0010", "20", "30", "40", "50", None, "  "],
+            }
+        )
+
+        skus, missing_brand_column = normalized_skus_from_brand_filter(
+            df,
+            selected_brands=["ACME"],
+            brand_column="Brand",
+            sku_column="Sku",
+        )
+
+        self.assertEqual(skus, {"10", "20"})
+        self.assertFalse(missing_brand_column)
+        self.assertEqual(
+            normalized_skus_from_brand_filter(
+                df,
+                selected_brands=["Acme"],
+                brand_column="Missing",
+                sku_column="Sku",
+            ),
+            (set(), True),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
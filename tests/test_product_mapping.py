@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 import pandas as pd
@@ -69,6 +70,52 @@ class ProductMappingTests(unittest.TestCase):
 
         self.assertEqual(hicore_map["100"][0].stock, "4")
 
+    def test_build_product_map_strips_text_columns_and_blanks_missing_values(self) -> None:
+        df_magento = pd.DataFrame(
+            [
+                {"sku": " 100 ", "name": None, "qty": "1"},
+                {"sku": float("nan"), "name": " Speaker ", "qty": "2"},
+            ]
+        )
+
+        magento_map = build_product_map(
+            df_magento,
+            source="magento",
+            columns={"sku": "sku", "name": "name", "stock": "qty"},
+        )
+
+        self.assertEqual(sorted(magento_map.keys()), ["", "100"])
+        self.assertEqual(magento_map["100"][0].name, "")
+        self.assertEqual(magento_map[""][0].name, "Speaker")
+        self.assertEqual(magento_map[""][0].supplier, "")
+
+    def test_built_products_are_slotted_and_picklable(self) -> None:
+        magento_map = build_product_map(
+            pd.DataFrame([{"sku": "100", "name": "Amp", "qty": "1"}]),
+            source="magento",
+            columns={"sku": "sku", "name": "name", "stock": "qty"},
+        )
+        product = magento_map["100"][0]
+
+        self.assertFalse(hasattr(product, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(product)), product)
+
+    def test_build_product_map_skips_excluded_normalized_skus(self) -> None:
+        magento_map = build_product_map(
+            pd.DataFrame(
+                [
+                    {"sku": "0100", "name": "Amp", "qty": "1"},
+                    {"sku": "200", "name": "Cable", "qty": "2"},
+                    {"sku": "", "name": "Blank", "qty": "3"},
+                ]
+            ),
+            source="magento",
+            columns={"sku": "sku", "name": "name", "stock": "qty"},
+            excluded_normalized_skus={"100", ""},
+        )
+
+        self.assertEqual(sorted(magento_map.keys()), ["", "200"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,16 @@
 import unittest
 
+import pandas as pd
+
+from listcompare.core.products.product_diff import normalize_sku
 from listcompare.core.products.product_normalization import (
     compute_hicore_stock,
+    compute_hicore_stock_with_fallback,
+    compute_hicore_stock_with_fallback_values,
     normalise_price,
     normalise_stock,
+    normalise_stock_values,
+    normalize_sku_values,
 )
 
 
@@ -21,6 +28,40 @@ class ProductNormalizationTests(unittest.TestCase):
         self.assertEqual(compute_hicore_stock("12,5", "0,5"), "12")
         self.assertEqual(compute_hicore_stock("", "1"), "")
 
+    def test_vectorised_stock_helpers_match_scalar_helpers(self) -> None:
+        raw_values = ["007", "-0", " 1 000 ", "1,50", "in stock", "", None, "12345678901234567890"]
+        values = pd.Series(raw_values, dtype=object, index=[3] * len(raw_values))
+        reserved = pd.Series(["1", "", "x", "0,5", None, "2", "1", "1"], dtype=object)
+        stock = pd.Series(["9"] * len(raw_values), dtype=object)
+
+        self.assertEqual(
+            normalise_stock_values(values),
+            [normalise_stock(value) for value in raw_values],
+        )
+        self.assertEqual(
+            compute_hicore_stock_with_fallback_values(values, reserved, stock),
+            [
+                compute_hicore_stock_with_fallback(total_raw, reserved_raw, stock_raw)
+                for total_raw, reserved_raw, stock_raw in zip(
+                    raw_values,
+                    reserved.tolist(),
+                    stock.tolist(),
+                )
+            ],
+        )
+
+    def test_normalize_sku_values_matches_scalar_normalize_sku(self) -> None:
+        raw_values = ["  00123 ", "000", "0", "A-01", "", "   ", 42, None]
+        values = pd.Series(raw_values, dtype=object, index=[7] * len(raw_values))
+
+        result = normalize_sku_values(values)
+
+        self.assertEqual(result.index.tolist(), values.index.tolist())
+        self.assertEqual(
+            result.tolist(),
+            [normalize_sku("" if value is None else str(value)) for value in raw_values],
+        )
+
     def test_normalise_price_handles_currency_text_and_decimals(self) -> None:
         self.assertEqual(normalise_price("100,00 SEK"), "100")
         self.assertEqual(normalise_price("SEK 1 234,50"), "1234.5")
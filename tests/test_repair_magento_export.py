@@ -0,0 +1,52 @@
+import unittest
+
+import pandas as pd
+
+from listcompare.core.products.repair_magento_export import repair_shifted_magento_rows
+
+
+class RepairMagentoExportTests(unittest.TestCase):
+    def test_repair_shifted_magento_rows_moves_values_back_into_place(self) -> None:
+        df_magento = pd.DataFrame(
+            [
+                {
+                    "name": '"Speaker; black";"00123"',
+                    "sku": "499",
+                    "price": "3",
+                    "qty": "https://example.test/speaker",
+                    "url": None,
+                },
+                {
+                    "name": "Amp",
+                    "sku": "100",
+                    "price": "999",
+                    "qty": "2",
+                    "url": "https://example.test/amp",
+                },
+            ]
+        )
+        original = df_magento.copy()
+
+        repaired_df, fixed = repair_shifted_magento_rows(df_magento)
+
+        self.assertEqual(fixed, 1)
+        self.assertEqual(
+            repaired_df.iloc[0].tolist(),
+            ["Speaker", 'black";"00123', "499", "3", "https://example.test/speaker"],
+        )
+        self.assertEqual(repaired_df.iloc[1].tolist(), original.iloc[1].tolist())
+        pd.testing.assert_frame_equal(df_magento, original)
+
+    def test_repair_shifted_magento_rows_returns_input_when_nothing_is_shifted(self) -> None:
+        df_magento = pd.DataFrame(
+            [{"name": "Amp", "sku": "100", "price": "999", "qty": "2", "url": ""}]
+        )
+
+        repaired_df, fixed = repair_shifted_magento_rows(df_magento)
+
+        self.assertEqual(fixed, 0)
+        self.assertIs(repaired_df, df_magento)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ from listcompare.core.suppliers.prepare import (
     SUPPLIER_PREPARE_IGNORE_GROUP,
     build_supplier_prepare_analysis,
     finalize_supplier_prepare_analysis,
+    supplier_prepare_signature,
 )
 
 
@@ -246,6 +247,28 @@ class SupplierPrepareUtilsTests(unittest.TestCase):
         self.assertEqual(prepared_df["Art.m\u00e4rkning"].tolist(), ["00123"])
         self.assertEqual(prepared_df["Artikelnamn"].tolist(), ["Receiver"])
 
+    def test_prepare_signature_uses_the_given_file_digest(self) -> None:
+        signature_kwargs = {
+            "supplier_name": "EM Nordic",
+            "supplier_file_name": "supplier.csv",
+            "supplier_bytes": b"SupplierSku;NameCol\n100;Speaker\n",
+        }
+
+        self.assertEqual(
+            supplier_prepare_signature(**signature_kwargs, supplier_file_digest="abc"),
+            supplier_prepare_signature(**signature_kwargs, supplier_file_digest="abc"),
+        )
+        self.assertNotEqual(
+            supplier_prepare_signature(**signature_kwargs, supplier_file_digest="abc"),
+            supplier_prepare_signature(**signature_kwargs, supplier_file_digest="def"),
+        )
+        self.assertNotEqual(
+            supplier_prepare_signature(**signature_kwargs),
+            supplier_prepare_signature(
+                **{**signature_kwargs, "supplier_bytes": b"SupplierSku;NameCol\n200;Speaker\n"}
+            ),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
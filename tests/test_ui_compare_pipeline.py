@@ -1,12 +1,15 @@
 import io
 import unittest
+from unittest.mock import patch
 
 import pandas as pd
 
 from listcompare.core.products.product_schema import HICORE_COLUMNS
+from listcompare.interfaces.ui.io import uploads
 from listcompare.interfaces.ui.services.compare_pipeline import (
     build_compare_artifacts,
     load_compare_input_data,
+    load_hicore_compare_df,
 )
 
 
@@ -47,6 +50,18 @@ class ComparePipelineTests(unittest.TestCase):
         self.assertEqual(loaded_hicore_df[HICORE_COLUMNS["sku"]].tolist(), ["001"])
         self.assertEqual(loaded_magento_df["sku"].tolist(), ["1"])
 
+    def test_load_hicore_compare_df_uses_the_given_digest_without_hashing(self) -> None:
+        upload_bytes = _to_csv_bytes(pd.DataFrame([{HICORE_COLUMNS["sku"]: "001"}]), sep=";")
+        hicore_digest = uploads._upload_digest(upload_bytes)
+
+        with patch.object(uploads, "_upload_digest") as upload_digest:
+            loaded_df = load_hicore_compare_df(
+                "hicore.csv", upload_bytes, hicore_digest=hicore_digest
+            )
+
+        upload_digest.assert_not_called()
+        self.assertEqual(loaded_df[HICORE_COLUMNS["sku"]].tolist(), ["001"])
+
     def test_build_compare_artifacts_collects_export_skus_and_warning(self) -> None:
         sku_col = HICORE_COLUMNS["sku"]
         name_col = HICORE_COLUMNS["name"]
@@ -1,4 +1,5 @@
 import io
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -6,6 +7,11 @@ from unittest.mock import patch
 from openpyxl import Workbook
 
 from listcompare.core.products.product_schema import HICORE_COLUMNS
+from listcompare.interfaces.ui.io.index_names import (
+    _load_suppliers_from_index,
+    _merge_supplier_lists,
+    _save_suppliers_to_index,
+)
 from listcompare.interfaces.ui.services import index_sync
 from listcompare.interfaces.ui.services.shared_sync import SharedSyncStatus
 
@@ -29,6 +35,26 @@ def _xlsx_bytes_from_rows(
 
 
 class IndexSyncTests(unittest.TestCase):
+    def test_merge_supplier_lists_dedupes_case_insensitively_and_reports_new_names(self) -> None:
+        merged, new_names = _merge_supplier_lists(
+            ["sony", " Acme ", "nan", ""],
+            ["Zeta", "ACME", "beta", "zeta", "Sony"],
+        )
+
+        self.assertEqual(merged, ["Acme", "beta", "sony", "Zeta"])
+        self.assertEqual(new_names, ["beta", "Zeta"])
+
+    def test_load_suppliers_from_index_rereads_after_save(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "suppliers.txt"
+            self.assertEqual(_load_suppliers_from_index(path)[0], [])
+
+            _save_suppliers_to_index(path, ["Acme"])
+            self.assertEqual(_load_suppliers_from_index(path), (["Acme"], None))
+
+            _save_suppliers_to_index(path, ["Acme", "Beta"])
+            self.assertEqual(_load_suppliers_from_index(path), (["Acme", "Beta"], None))
+
     def test_sync_index_options_reads_names_from_hicore_excel_upload(self) -> None:
         sku_col = HICORE_COLUMNS["sku"]
         supplier_col = HICORE_COLUMNS["supplier"]
@@ -1,4 +1,8 @@
+import json
+import os
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
 from listcompare.core.suppliers.profile import (
     SUPPLIER_HICORE_SKU_COLUMN,
@@ -9,6 +13,9 @@ from listcompare.interfaces.ui.persistence import (
     settings_store,
     shared_sync_store,
 )
+from listcompare.interfaces.ui.services.shared_sync import SharedSyncStatus
+from listcompare.interfaces.ui.session import bootstrap, profile_state
+from tests._support import RepoTemporaryDirectory
 
 
 class _InMemoryPath:
@@ -44,6 +51,22 @@ class UiPersistenceStoreTests(unittest.TestCase):
         self.assertIsNone(err)
         self.assertEqual(suppliers, ["Acme", "Sony"])
 
+    def test_index_store_skips_unchanged_writes_and_leaves_no_temp_file(self) -> None:
+        with RepoTemporaryDirectory("index-store-write") as temp_dir:
+            path = Path(temp_dir) / "supplier_index.txt"
+            index_store.save_suppliers_to_index(path, ["Sony", "Acme"])
+            os.utime(path, ns=(0, 0))
+
+            index_store.save_suppliers_to_index(path, ["Sony", "Acme", "sony"])
+            self.assertEqual(path.stat().st_mtime_ns, 0)
+
+            index_store.save_suppliers_to_index(path, ["Sony", "Yamaha"])
+            suppliers, err = index_store.load_suppliers_from_index(path)
+
+            self.assertIsNone(err)
+            self.assertEqual(suppliers, ["Sony", "Yamaha"])
+            self.assertEqual(sorted(child.name for child in Path(temp_dir).iterdir()), [path.name])
+
     def test_index_store_reports_missing_index(self) -> None:
         path = _InMemoryPath()
 
@@ -65,6 +88,22 @@ class UiPersistenceStoreTests(unittest.TestCase):
         self.assertIsNone(load_err)
         self.assertEqual(settings["excluded_brands"], ["Acme", "Sony"])
 
+    def test_settings_store_reuses_parsed_settings_until_file_changes(self) -> None:
+        with RepoTemporaryDirectory("settings-store-cache") as temp_dir:
+            path = Path(temp_dir) / "ui_settings.json"
+            self.assertIsNone(settings_store.save_ui_settings(path, excluded_brands=["Sony"]))
+
+            first, _ = settings_store.load_ui_settings(path)
+            first["excluded_brands"].clear()
+            with patch.object(settings_store.json, "loads", wraps=json.loads) as loads_mock:
+                second, _ = settings_store.load_ui_settings(path)
+                loads_mock.assert_not_called()
+            self.assertEqual(second["excluded_brands"], ["Sony"])
+
+            self.assertIsNone(settings_store.save_ui_settings(path, excluded_brands=["Acme", "Sony"]))
+            third, _ = settings_store.load_ui_settings(path)
+            self.assertEqual(third["excluded_brands"], ["Acme", "Sony"])
+
     def test_profile_store_roundtrip(self) -> None:
         path = _InMemoryPath()
         save_err = profile_store.save_profiles(
@@ -91,6 +130,108 @@ class UiPersistenceStoreTests(unittest.TestCase):
             "SupplierSku",
         )
 
+    def test_profile_store_reuses_parsed_profiles_until_file_changes(self) -> None:
+        profile_store.clear_profiles_cache()
+        with RepoTemporaryDirectory("profile-store-cache") as temp_dir:
+            path = Path(temp_dir) / "supplier_transform_profiles.json"
+            profiles = {
+                "EM Nordic": {
+                    "target_to_source": {SUPPLIER_HICORE_SKU_COLUMN: "SupplierSku"},
+                    "options": {},
+                }
+            }
+            self.assertIsNone(profile_store.save_profiles(path, profiles=profiles))
+
+            first, _ = profile_store.load_profiles(path)
+            first["EM Nordic"]["target_to_source"].clear()
+            with patch.object(profile_store.json, "loads", wraps=json.loads) as loads_mock:
+                second, _ = profile_store.load_profiles(path)
+                loads_mock.assert_not_called()
+            self.assertEqual(
+                second["EM Nordic"]["target_to_source"][SUPPLIER_HICORE_SKU_COLUMN],
+                "SupplierSku",
+            )
+
+            path.write_text(json.dumps({"profiles": {}}), encoding="utf-8")
+            os.utime(path, ns=(0, 0))
+            third, _ = profile_store.load_profiles(path)
+            self.assertEqual(third, {})
+
+    def test_profile_store_save_seeds_cache_for_next_load(self) -> None:
+        profile_store.clear_profiles_cache()
+        with RepoTemporaryDirectory("profile-store-seed") as temp_dir:
+            path = Path(temp_dir) / "supplier_transform_profiles.json"
+            profiles = {
+                " EM Nordic ": {
+                    "target_to_source": {SUPPLIER_HICORE_SKU_COLUMN: " SupplierSku "},
+                    "options": {},
+                },
+                "Empty": {"target_to_source": {}},
+            }
+            self.assertIsNone(profile_store.save_profiles(path, profiles=profiles))
+
+            with patch.object(profile_store.json, "loads", wraps=json.loads) as loads_mock:
+                loaded, load_error = profile_store.load_profiles(path)
+                loads_mock.assert_not_called()
+            self.assertIsNone(load_error)
+            profile_store.clear_profiles_cache()
+            self.assertEqual(loaded, profile_store.load_profiles(path)[0])
+            self.assertEqual(list(loaded), ["EM Nordic"])
+
+    def test_persist_profile_keeps_the_saved_profile_order(self) -> None:
+        profile_store.clear_profiles_cache()
+        with RepoTemporaryDirectory("profile-state-order") as temp_dir:
+            path = Path(temp_dir) / "supplier_transform_profiles.json"
+            profiles = {
+                supplier_name: {
+                    "target_to_source": {SUPPLIER_HICORE_SKU_COLUMN: "SupplierSku"},
+                    "options": {},
+                }
+                for supplier_name in ("EM Nordic", "Acme", "Zeta")
+            }
+            self.assertIsNone(profile_store.save_profiles(path, profiles=profiles))
+            sync_status = SharedSyncStatus(level="info", message="", shared_folder="")
+            session_state: dict[str, object] = {}
+
+            with patch.object(
+                profile_state, "_supplier_transform_profiles_path", return_value=path
+            ), patch.object(profile_state, "_sync_shared_files", return_value=sync_status):
+                save_error = profile_state.persist_supplier_transform_profile(
+                    session_state,
+                    supplier_name="EM Nordic",
+                    target_to_source={SUPPLIER_HICORE_SKU_COLUMN: "NewSku"},
+                    options={},
+                )
+
+            self.assertIsNone(save_error)
+            saved = json.loads(path.read_text(encoding="utf-8"))["profiles"]
+            self.assertEqual(list(saved), ["EM Nordic", "Acme", "Zeta"])
+            self.assertEqual(
+                saved["EM Nordic"]["target_to_source"][SUPPLIER_HICORE_SKU_COLUMN],
+                "NewSku",
+            )
+
+    def test_init_session_state_reads_settings_files_only_until_initialized(self) -> None:
+        persisted = {
+            "excluded_brands": ["Sony"],
+            "ui_settings_load_error": None,
+            "shared_sync_folder": "",
+            "shared_sync_load_error": None,
+            "supplier_transform_profiles": {},
+            "supplier_transform_profiles_load_error": None,
+        }
+        session_state: dict[str, object] = {}
+
+        with patch.object(bootstrap, "_persisted_defaults", return_value=persisted) as load:
+            bootstrap.init_session_state(session_state)
+            session_state["excluded_brands"] = ["Yamaha"]
+            bootstrap.init_session_state(session_state)
+
+        load.assert_called_once()
+        self.assertEqual(session_state["excluded_brands"], ["Yamaha"])
+        self.assertEqual(session_state["_auto_shared_sync_cache"], {})
+        self.assertIsNone(session_state["compare_ui_result"])
+
     def test_shared_sync_store_roundtrip(self) -> None:
         path = _InMemoryPath()
         save_err = shared_sync_store.save_shared_sync_config(
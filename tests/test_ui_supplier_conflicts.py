@@ -6,6 +6,7 @@ from listcompare.core.suppliers.prepare import (
     SUPPLIER_PREPARE_IGNORE_GROUP,
     build_supplier_prepare_analysis,
 )
+from listcompare.interfaces.ui.features.supplier_compare.actions import _frame_digest
 from listcompare.interfaces.ui.features.supplier_compare.conflicts import (
     _ignore_all_conflict_choices,
 )
@@ -75,6 +76,22 @@ class SupplierConflictUiTests(unittest.TestCase):
         )
         self.assertEqual(ignored_rows_df["Art.märkning"].tolist(), ["100", "100"])
 
+    def test_frame_digest_changes_when_any_single_row_changes(self) -> None:
+        # Past 50k rows st.cache_data only samples a frame, so the digest must not.
+        prepared_df = pd.DataFrame(
+            {
+                "Art.m\u00e4rkning": [str(index) for index in range(60_000)],
+                "Artikelnamn": ["Speaker"] * 60_000,
+            }
+        )
+        baseline = _frame_digest(prepared_df)
+        self.assertEqual(_frame_digest(prepared_df.copy()), baseline)
+
+        for row in (1, 12_345, 59_999):
+            edited_df = prepared_df.copy()
+            edited_df.loc[row, "Artikelnamn"] = "Speaker Bundle"
+            self.assertNotEqual(_frame_digest(edited_df), baseline)
+
 
 if __name__ == "__main__":
     unittest.main()
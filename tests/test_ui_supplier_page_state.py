@@ -6,6 +6,7 @@ from listcompare.interfaces.ui.common import (
     SUPPLIER_PROFILE_MODE_EDITOR,
     SUPPLIER_PROFILE_MODE_OVERVIEW,
 )
+from listcompare.interfaces.ui.session.profile_access import split_suppliers_by_profile
 from listcompare.interfaces.ui.session.supplier_page_state import (
     apply_requested_supplier_page_state,
 )
@@ -68,6 +69,27 @@ class SupplierPageStateTests(unittest.TestCase):
 
         self.assertEqual(session_state["supplier_profiles_mode"], SUPPLIER_PROFILE_MODE_OVERVIEW)
 
+    def test_split_suppliers_by_profile_uses_saved_profile_mappings(self) -> None:
+        session_state: dict[str, object] = {
+            "supplier_transform_profiles": {
+                "Acme": {"target_to_source": {"Art.märkning": "SKU"}},
+                "Empty": {"target_to_source": {}},
+                "Broken": "not-a-profile",
+                "NameOnly": {
+                    "target_to_source": {"Artikelnamn": "Namn"},
+                    "composite_fields": {"Artikelnamn": ["Namn", "Modell"]},
+                },
+            },
+        }
+
+        self.assertEqual(
+            split_suppliers_by_profile(
+                session_state,
+                [" Acme ", "Empty", "Broken", "NameOnly", "Sony"],
+            ),
+            ([" Acme "], ["Empty", "Broken", "NameOnly", "Sony"]),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,16 @@
 import io
 import unittest
+from unittest.mock import patch
 
 import pandas as pd
 
+from listcompare.core.products.product_mapping import build_product_map
 from listcompare.core.products.product_schema import HICORE_COLUMNS
+from listcompare.interfaces.ui.io import uploads
 from listcompare.interfaces.ui.services.supplier_pipeline import (
     build_supplier_artifacts,
     load_hicore_compare_df,
+    load_hicore_product_map,
 )
 
 
@@ -35,6 +39,40 @@ class SupplierPipelineTests(unittest.TestCase):
 
         self.assertEqual(loaded_df[HICORE_COLUMNS["sku"]].tolist(), ["001"])
 
+    def test_load_hicore_product_map_matches_map_built_from_loaded_df(self) -> None:
+        df_hicore = pd.DataFrame(
+            [
+                {HICORE_COLUMNS["sku"]: "001", HICORE_COLUMNS["name"]: "Amp"},
+                {HICORE_COLUMNS["sku"]: "002", HICORE_COLUMNS["name"]: "Cable"},
+            ]
+        )
+        upload_bytes = _to_csv_bytes(df_hicore)
+
+        self.assertEqual(
+            load_hicore_product_map("hicore.csv", upload_bytes),
+            build_product_map(
+                load_hicore_compare_df("hicore.csv", upload_bytes),
+                source="hicore",
+                columns=HICORE_COLUMNS,
+            ),
+        )
+
+    def test_load_hicore_readers_use_the_given_digest_without_hashing(self) -> None:
+        upload_bytes = _to_csv_bytes(pd.DataFrame([{HICORE_COLUMNS["sku"]: "001"}]))
+        hicore_digest = uploads._upload_digest(upload_bytes)
+
+        with patch.object(uploads, "_upload_digest") as upload_digest:
+            loaded_df = load_hicore_compare_df(
+                "hicore.csv", upload_bytes, hicore_digest=hicore_digest
+            )
+            product_map = load_hicore_product_map(
+                "hicore.csv", upload_bytes, hicore_digest=hicore_digest
+            )
+
+        upload_digest.assert_not_called()
+        self.assertEqual(loaded_df[HICORE_COLUMNS["sku"]].tolist(), ["001"])
+        self.assertEqual(list(product_map), ["001"])
+
     def test_build_supplier_artifacts_collects_domain_results_and_columns(self) -> None:
         sku_col = HICORE_COLUMNS["sku"]
         name_col = HICORE_COLUMNS["name"]
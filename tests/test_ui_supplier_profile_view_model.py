@@ -7,6 +7,7 @@ from listcompare.core.suppliers.profile import (
     SUPPLIER_TRANSFORM_DEFAULT_OPTIONS,
 )
 from listcompare.interfaces.ui.features.supplier_profiles.view_model import (
+    filter_supplier_names,
     selected_supplier_profile_state,
     supplier_file_unique_values,
     supplier_profile_filter_summary,
@@ -60,6 +61,14 @@ class SupplierProfileViewModelTests(unittest.TestCase):
         self.assertEqual(result.preview_row_count, 1)
         self.assertEqual(result.preview_df.columns.tolist(), ["SKU", "SKU"])
 
+    def test_filter_supplier_names_matches_casefolded_query_and_follows_list_changes(self) -> None:
+        names = ["Åkes Musik", "Acme", "BAKER"]
+
+        self.assertEqual(filter_supplier_names(names, " åKE "), ["Åkes Musik"])
+        self.assertEqual(filter_supplier_names(names, "ake"), ["BAKER"])
+        self.assertEqual(filter_supplier_names(names, ""), names)
+        self.assertEqual(filter_supplier_names(names + ["Make AB"], "ake"), ["BAKER", "Make AB"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -31,6 +31,22 @@ class UiTableStyleTests(unittest.TestCase):
         self.assertNotEqual(row_1_color, row_2_color)
         self.assertEqual(row_2_color, row_3_color)
 
+    def test_style_stock_mismatch_df_returns_plain_frame_past_styler_limit(self) -> None:
+        df = pd.DataFrame({"sku": ["1", "2", "3"], "source": ["hicore", "magento", "hicore"]})
+
+        with pd.option_context("styler.render.max_elements", 4):
+            styled = _style_stock_mismatch_df(df)
+
+        self.assertIsInstance(styled, pd.DataFrame)
+        pd.testing.assert_frame_equal(styled, df)
+
+    def test_style_stock_mismatch_df_skips_striping_for_a_single_row(self) -> None:
+        df = pd.DataFrame({"sku": ["1"], "source": ["hicore"]})
+
+        ctx = _style_stock_mismatch_df(df)._compute().ctx
+
+        self.assertEqual(dict(ctx), {})
+
 
 if __name__ == "__main__":
     unittest.main()
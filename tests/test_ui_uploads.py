@@ -7,14 +7,20 @@ from openpyxl import Workbook, load_workbook
 from listcompare.core.products.product_mapping import build_product_map
 from listcompare.core.products.product_schema import HICORE_COLUMNS
 from listcompare.core.suppliers.profile import build_supplier_hicore_renamed_copy
-from listcompare.interfaces.ui.io.exports import _df_excel_bytes
+from listcompare.interfaces.ui.common import FILE_STATE_KEYS
+from listcompare.interfaces.ui.io.exports import _df_csv_bytes, _df_excel_bytes, _sku_csv_bytes
 from listcompare.interfaces.ui.io.index_names import _load_names_from_uploaded_hicore
 from listcompare.interfaces.ui.io.uploads import (
+    _csv_encodings_for,
     _normalize_hicore_identifier_columns,
+    _ranked_fallback_separators,
     _read_hicore_upload,
     _read_supplier_upload,
+    _unambiguous_csv_separator,
+    _upload_digest,
 )
 from listcompare.interfaces.ui.services.compare_pipeline import load_hicore_compare_df
+from listcompare.interfaces.ui.session.file_inputs import store_uploaded_file, stored_file_digest
 
 
 def _xlsx_bytes_from_rows(rows: list[list[object]], *, number_formats: dict[str, str]) -> bytes:
@@ -218,6 +224,109 @@ class UiUploadTests(unittest.TestCase):
         self.assertTrue(has_supplier_column)
         self.assertTrue(has_brand_column)
 
+    def test_load_names_from_uploaded_hicore_reads_csv_upload(self) -> None:
+        df_hicore = pd.DataFrame(
+            [
+                {
+                    HICORE_COLUMNS["sku"]: "0001",
+                    HICORE_COLUMNS["supplier"]: " EM Nordic ",
+                    HICORE_COLUMNS["brand"]: "Sony",
+                },
+                {
+                    HICORE_COLUMNS["sku"]: "0002",
+                    HICORE_COLUMNS["supplier"]: "em nordic",
+                    HICORE_COLUMNS["brand"]: "",
+                },
+            ]
+        )
+
+        supplier_names, brand_names, has_supplier_column, has_brand_column = (
+            _load_names_from_uploaded_hicore("hicore.csv", _hicore_csv_bytes(df_hicore))
+        )
+
+        self.assertEqual(supplier_names, ["EM Nordic"])
+        self.assertEqual(brand_names, ["Sony"])
+        self.assertTrue(has_supplier_column)
+        self.assertTrue(has_brand_column)
+
+    def test_csv_encoding_candidates_follow_bom_and_utf8_sniff(self) -> None:
+        self.assertEqual(_csv_encodings_for("\ufeffSku;Namn\n".encode("utf-8")), ("utf-8-sig",))
+        self.assertEqual(
+            _csv_encodings_for("Sku;Namn\n1;\u00c5ke\n".encode("utf-8")),
+            ("utf-8-sig", "cp1252", "latin1"),
+        )
+        self.assertEqual(
+            _csv_encodings_for("Sku;Namn\n1;\u00c5ke\n".encode("cp1252")),
+            ("cp1252", "latin1"),
+        )
+        self.assertEqual(_csv_encodings_for(b"Sku;Namn\n1;A\x8dB\n"), ("latin1",))
+
+    def test_read_supplier_upload_decodes_cp1252_csv(self) -> None:
+        upload_bytes = "Sku;Namn\n0001;\u00c5ke \u20ac\n".encode("cp1252")
+
+        df_supplier = _read_supplier_upload("supplier.csv", upload_bytes)
+
+        self.assertEqual(df_supplier["Sku"].tolist(), ["0001"])
+        self.assertEqual(df_supplier["Namn"].tolist(), ["\u00c5ke \u20ac"])
+
+    def test_read_supplier_upload_returns_independent_frames_from_cache(self) -> None:
+        upload_bytes = "Sku;Namn\n0001;A\n".encode("utf-8")
+
+        first = _read_supplier_upload("supplier.csv", upload_bytes)
+        first.loc[0, "Namn"] = "changed"
+        second = _read_supplier_upload("supplier.csv", upload_bytes)
+
+        self.assertEqual(second["Namn"].tolist(), ["A"])
+
+    def test_sku_csv_bytes_matches_dataframe_csv_export(self) -> None:
+        skus = ["0001", "A;B", 'Q"X', "", "\u00c5ke"]
+
+        self.assertEqual(
+            _sku_csv_bytes(skus),
+            _df_csv_bytes(pd.DataFrame({"Art.m\u00e4rkning": skus})),
+        )
+        self.assertEqual(_sku_csv_bytes([]), _df_csv_bytes(pd.DataFrame({"Art.m\u00e4rkning": []})))
+
+    def test_stored_upload_keeps_its_digest_next_to_the_bytes(self) -> None:
+        uploaded_file = io.BytesIO("Sku;Namn\n0001;A\n".encode("utf-8"))
+        uploaded_file.name = "supplier.csv"
+        session_state: dict[str, object] = {}
+
+        store_uploaded_file(
+            session_state,
+            kind="supplier",
+            uploaded_file=uploaded_file,
+            clear_all_run_state=lambda: None,
+        )
+
+        stored = session_state[FILE_STATE_KEYS["supplier"]]
+        self.assertEqual(stored["digest"], _upload_digest(stored["bytes"]))
+        self.assertEqual(stored_file_digest(stored), stored["digest"])
+
+    def test_stored_file_digest_fills_in_uploads_stored_without_one(self) -> None:
+        stored: dict[str, object] = {"name": "hicore.csv", "bytes": b"Art.m;Namn\n1;A\n"}
+
+        digest = stored_file_digest(stored)
+
+        self.assertEqual(digest, _upload_digest(b"Art.m;Namn\n1;A\n"))
+        self.assertEqual(stored["digest"], digest)
+
+    def test_ranked_fallback_separators_prefers_consistent_header_separator(self) -> None:
+        self.assertEqual(
+            _ranked_fallback_separators(b"Sku|Namn|Pris\n1|A, B|10\n2|C|20\n")[0],
+            "|",
+        )
+        self.assertEqual(
+            _ranked_fallback_separators(b"Sku\tNamn\n1\tA;B\n"),
+            ("\t", ";", ",", "|"),
+        )
+        self.assertEqual(_ranked_fallback_separators(b""), (";", ",", "\t", "|"))
+
+    def test_unambiguous_csv_separator_requires_a_single_consistent_candidate(self) -> None:
+        self.assertEqual(_unambiguous_csv_separator(b"Sku;Namn;Pris\n1;A, B;10,5\n"), ";")
+        self.assertIsNone(_unambiguous_csv_separator(b"Sku;Namn,Pris\n1;A,10\n"))
+        self.assertIsNone(_unambiguous_csv_separator(b"Sku;Namn\n1;A;B\n"))
+
     def test_normalize_hicore_identifier_columns_strips_integer_like_decimal_suffixes(self) -> None:
         sku_col = HICORE_COLUMNS["sku"]
         article_number_col = HICORE_COLUMNS["article_number"]